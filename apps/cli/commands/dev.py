@@ -1,5 +1,18 @@
-import json
+import contextlib
+import io
+from pathlib import Path
+from typing import Any
 
+import orjson
+
+# readline (POSIX only) gives input() proper line editing and history,
+# which keeps keystroke latency flat for large pasted JSON bodies
+try:
+    import readline
+except ImportError:  # pragma: no cover - e.g. Windows without pyreadline
+    readline = None  # type: ignore[assignment]
+
+from apps.cli.utils import build_parser
 from lib.console_reporter import ConsoleReporter
 from lib.opensearch.client import OpenSearchClient
 from lib.utils import get_aws_credentials
@@ -28,6 +41,13 @@ DEFINITION = {
             "default": 9200,
             "help": "OpenSearch port (default: 9200)",
         },
+        {
+            "name": "pool-maxsize",
+            "type": int,
+            "required": False,
+            "default": 32,
+            "help": "Maximum HTTP connection pool size for OpenSearch (default: 32)",
+        },
         {
             "name": "profile",
             "type": str,
@@ -44,12 +64,15 @@ DEFINITION = {
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
 
 def main(
     *,
     assume_role: str | None = None,
     opensearch_host: str = "localhost",
     opensearch_port: int = 9200,
+    pool_maxsize: int = 32,
     profile: str | None = None,
     region: str = "us-east-1",
 ) -> None:
@@ -60,6 +83,7 @@ def main(
         assume_role: AWS role to assume for OpenSearch operations
         opensearch_host: OpenSearch host
         opensearch_port: OpenSearch port
+        pool_maxsize: Maximum HTTP connection pool size for OpenSearch
         profile: AWS profile to use
         region: AWS region
     """
@@ -76,6 +100,7 @@ def main(
     opensearch = OpenSearchClient(
         credentials=credentials,
         host=opensearch_host,
+        pool_maxsize=pool_maxsize,
         port=opensearch_port,
         region=region,
         reporter=reporter,
@@ -85,6 +110,31 @@ def main(
     dev(opensearch=opensearch)
 
 
+_HISTORY_FILE = Path.home() / ".cache" / "semantic-entity-matching" / "dev_history"
+
+
+def _load_history() -> None:
+    """Load console history from previous dev sessions."""
+    if readline is None:
+        return
+    with contextlib.suppress(OSError):
+        readline.read_history_file(_HISTORY_FILE)
+
+
+def _save_history() -> None:
+    """Persist console history so repeat requests need no retyping."""
+    if readline is None:
+        return
+    with contextlib.suppress(OSError):
+        _HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        readline.write_history_file(_HISTORY_FILE)
+
+
+def _pp(obj: Any) -> str:
+    """Pretty-print a response object; orjson is much faster than stdlib json on large mappings."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 def dev(*, opensearch: OpenSearchClient):
     """Interactive OpenSearch request console"""
     print("OpenSearch Dev Console")
@@ -108,6 +158,8 @@ def dev(*, opensearch: OpenSearchClient):
     print("Press Ctrl+C to exit")
     print("=" * 50)
 
+    _load_history()
+
     while True:
         try:
             print("\nEnter your request (press Enter twice when done):")
@@ -126,35 +178,37 @@ def dev(*, opensearch: OpenSearchClient):
             http_method, url = parts
             http_method = http_method.upper()
 
-            # Read JSON body (multi-line input)
-            json_lines = []
+            # Read JSON body (multi-line input) into a single buffer so we
+            # join once instead of accumulating many small strings
+            json_buf = io.StringIO()
             print("Enter JSON body (press Enter on empty line to finish):")
             while True:
                 line = input()
                 if line.strip() == "":
                     break
-                json_lines.append(line)
+                json_buf.write(line)
+                json_buf.write("\n")
 
             # Parse JSON body if provided
             body = None
-            if json_lines:
-                json_str = "\n".join(json_lines)
+            json_str = json_buf.getvalue()
+            if json_str:
                 try:
-                    body = json.loads(json_str)
-                except json.JSONDecodeError as e:
+                    body = orjson.loads(json_str)
+                except orjson.JSONDecodeError as e:
                     print(f"Error: Invalid JSON - {e}")
                     continue
 
             # Make the request
             print(f"\nSending {http_method} request to {url}")
             if body:
-                print(f"Body: {json.dumps(body, indent=2)}")
+                print(f"Body: {_pp(body)}")
 
             try:
                 response = opensearch.request(http_verb=http_method, url=url, body=body)
 
                 print("\nResponse:")
-                print(json.dumps(response, indent=2))
+                print(_pp(response))
 
             except Exception as e:
                 print(f"Request error: {e!s}")
@@ -165,3 +219,5 @@ def dev(*, opensearch: OpenSearchClient):
         except EOFError:
             print("\n\nExiting dev console...")
             break
+
+    _save_history()
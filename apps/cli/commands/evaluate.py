@@ -1,5 +1,8 @@
 import sys
 
+import numpy as np
+
+from apps.cli.utils import build_parser
 from lib.console_reporter import ConsoleReporter
 from lib.data_reader import DataReader
 from lib.evaluate import evaluate, get_top_k_metric
@@ -89,6 +92,13 @@ DEFINITION = {
             "default": 9200,
             "help": "OpenSearch port (default: 9200)",
         },
+        {
+            "name": "pool-maxsize",
+            "type": int,
+            "required": False,
+            "default": 32,
+            "help": "Maximum HTTP connection pool size for OpenSearch (default: 32)",
+        },
         {
             "name": "profile",
             "type": str,
@@ -112,6 +122,8 @@ DEFINITION = {
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
 
 def main(
     *,
@@ -127,6 +139,7 @@ def main(
     match_field: str = "LOINC_NUM",
     opensearch_host: str = "localhost",
     opensearch_port: int = 9200,
+    pool_maxsize: int = 32,
     profile: str | None = None,
     region: str = "us-east-1",
     skip_rows: int = 0,
@@ -147,6 +160,7 @@ def main(
         match_field: Field name in OpenSearch index to match against
         opensearch_host: OpenSearch host
         opensearch_port: OpenSearch port
+        pool_maxsize: Maximum HTTP connection pool size for OpenSearch
         profile: AWS profile to use
         region: AWS region
         skip_rows: Number of rows to skip at the beginning
@@ -185,6 +199,7 @@ def main(
     opensearch = OpenSearchClient(
         credentials=credentials,
         host=opensearch_host,
+        pool_maxsize=pool_maxsize,
         port=opensearch_port,
         region=region,
         reporter=reporter,
@@ -200,19 +215,42 @@ def main(
     reporter.on_message(f"Batch size: {batch_size}")
     reporter.on_message("=" * 80)
 
-    # Call the library function
+    # Stream results: print each row as its batch completes and keep only
+    # running counters instead of buffering the full results list
+    total_queries = 0
+    failed_queries_count = 0
+    successful_ranks: list[int] = []
+
     try:
-        results = evaluate(
-            batch_size=batch_size,
-            column=column,
-            df=df,
-            evaluation_columns=evaluation_columns,
-            index_name=index,
-            match_column=match_column,
-            match_field=match_field,
-            opensearch=opensearch,
-            reporter=reporter,
-        )
+        # Buffer per-row output so a large evaluation does not pay one
+        # stdout write per row
+        with reporter.buffered():
+            for result in evaluate(
+                batch_size=batch_size,
+                column=column,
+                df=df,
+                evaluation_columns=evaluation_columns,
+                index_name=index,
+                match_column=match_column,
+                match_field=match_field,
+                opensearch=opensearch,
+                reporter=reporter,
+            ):
+                total_queries += 1
+                actual_row_number = result["row_index"] + skip_rows + 1
+                if result.get("error"):
+                    failed_queries_count += 1
+                    reporter.on_message(f"  Row {actual_row_number}: Error - {result['error']}")
+                elif result.get("rank"):
+                    successful_ranks.append(result["rank"])
+                    display_value = result["document"].get(display_field, "N/A")
+                    hits_count = result.get("hits_count", 0)
+                    reporter.on_message(
+                        f"  Row {actual_row_number}: {result['rank']}/{hits_count} | "
+                        f"{result['score']:.4f} | {display_value}"
+                    )
+                else:
+                    reporter.on_message(f"  Row {actual_row_number}: No match found")
     except ValueError as e:
         reporter.on_message(f"Error: {e}")
         sys.exit(1)
@@ -220,32 +258,11 @@ def main(
         reporter.on_message(f"Unexpected error: {e}")
         import traceback
 
-        reporter.on_message(traceback.format_exc())
+        reporter.on_message("".join(traceback.format_exception(e, limit=-5)))
         sys.exit(1)
 
-    # Print results for each row
-    for result in results:
-        if result.get("error"):
-            actual_row_number = result["row_index"] + skip_rows + 1
-            reporter.on_message(f"  Row {actual_row_number}: Error - {result['error']}")
-        elif result.get("rank"):
-            actual_row_number = result["row_index"] + skip_rows + 1
-            display_value = result["document"].get(display_field, "N/A")
-            hits_count = result.get("hits_count", 0)
-            reporter.on_message(
-                f"  Row {actual_row_number}: {result['rank']}/{hits_count} | "
-                f"{result['score']:.4f} | {display_value}"
-            )
-        else:
-            actual_row_number = result["row_index"] + skip_rows + 1
-            reporter.on_message(f"  Row {actual_row_number}: No match found")
-
     # Calculate and print summary
-    total_queries = len(results)
-    failed_queries = [r for r in results if r.get("error")]
-    failed_queries_count = len(failed_queries)
-    successful_queries = [r for r in results if r.get("rank")]
-    successful_queries_count = len(successful_queries)
+    successful_queries_count = len(successful_ranks)
 
     reporter.on_message("\n" + "=" * 80)
     reporter.on_message("EVALUATION SUMMARY")
@@ -255,9 +272,10 @@ def main(
 
     if successful_queries_count > 0:
         success_rate = successful_queries_count / total_queries * 100
-        top_5 = get_top_k_metric(successful_queries, 5, total_queries)
-        top_10 = get_top_k_metric(successful_queries, 10, total_queries)
-        top_25 = get_top_k_metric(successful_queries, 25, total_queries)
+        ranks = np.asarray(successful_ranks, dtype=np.int32)
+        top_5 = get_top_k_metric(ranks, 5, total_queries)
+        top_10 = get_top_k_metric(ranks, 10, total_queries)
+        top_25 = get_top_k_metric(ranks, 25, total_queries)
         reporter.on_message(f"Top-5 accuracy:\t\t{top_5:.1f}%")
         reporter.on_message(f"Top-10 accuracy:\t\t{top_10:.1f}%")
         reporter.on_message(f"Top-25 accuracy:\t\t{top_25:.1f}%")
@@ -1,10 +1,18 @@
 import json
 import sys
 
-from apps.cli.utils import is_vector_embedding
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json still works
+    orjson = None  # type: ignore[assignment]
+
+from apps.cli.utils import build_parser, is_vector_embedding
 from lib.console_reporter import ConsoleReporter
 from lib.data_reader import DataReader
 from lib.ingest import ingest
+from lib.interfaces import IReporter
 from lib.opensearch.client import OpenSearchClient
 from lib.utils import get_aws_credentials
 
@@ -70,6 +78,13 @@ DEFINITION = {
             "default": 9200,
             "help": "OpenSearch port (default: 9200)",
         },
+        {
+            "name": "pool-maxsize",
+            "type": int,
+            "required": False,
+            "default": 32,
+            "help": "Maximum HTTP connection pool size for OpenSearch (default: 32)",
+        },
         {
             "name": "profile",
             "type": str,
@@ -93,6 +108,8 @@ DEFINITION = {
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
 
 def main(
     *,
@@ -105,6 +122,7 @@ def main(
     max_attempts: int = 5,
     opensearch_host: str = "localhost",
     opensearch_port: int = 9200,
+    pool_maxsize: int = 32,
     profile: str | None = None,
     region: str = "us-east-1",
     skip_rows: int = 0,
@@ -122,6 +140,7 @@ def main(
         max_attempts: Maximum number of retry attempts for ingestion
         opensearch_host: OpenSearch host
         opensearch_port: OpenSearch port
+        pool_maxsize: Maximum HTTP connection pool size for OpenSearch
         profile: AWS profile to use
         region: AWS region
         skip_rows: Number of rows to skip at the beginning
@@ -141,43 +160,92 @@ def main(
     opensearch = OpenSearchClient(
         credentials=credentials,
         host=opensearch_host,
+        pool_maxsize=pool_maxsize,
         port=opensearch_port,
         region=region,
         reporter=reporter,
     )
 
-    def parse_vector(value: str, column_name: str) -> list[float] | None:
-        """Parse string representation of vector to list using JSON."""
-        max_length = 100
-        try:
-            parsed = json.loads(value)
-            if is_vector_embedding(parsed):
-                return parsed
-            error_msg = value[:max_length] + "..." if len(value) > max_length else value
-            reporter.on_message(
-                f"Warning: Parsed value in column '{column_name}' is not a list: {error_msg}"
-            )
-        except json.JSONDecodeError:
-            error_msg = value[:max_length] + "..." if len(value) > max_length else value
-            reporter.on_message(
-                f"Warning: Could not parse vector in column '{column_name}': {error_msg}"
-            )
-        return None
-
     reader = DataReader(
         file_path=file,
         limit_rows=limit_rows,
         skip_rows=skip_rows,
         reporter=reporter,
-        transformations=[{"columns": knn_columns, "callback": parse_vector}],
     )
 
+    for column in knn_columns:
+        parse_vector_column(df=reader.df, column=column, reporter=reporter)
 
     ingest(
         delete=delete,
-        rows=reader.df.to_dict(orient="records"),
+        df=reader.df,
         index_name=index,
         max_attempts=max_attempts,
         opensearch=opensearch,
         reporter=reporter,
     )
+
+
+def parse_vector(value: str, column_name: str, reporter: IReporter) -> list[float] | None:
+    """Parse string representation of vector to list using JSON.
+
+    Uses orjson when available: its SIMD-accelerated parser is ~5x faster
+    than stdlib json on number-heavy arrays like embedding vectors.
+    """
+    max_length = 100
+    try:
+        parsed = orjson.loads(value) if orjson is not None else json.loads(value)
+        if is_vector_embedding(parsed):
+            return parsed
+        error_msg = value[:max_length] + "..." if len(value) > max_length else value
+        reporter.on_message(
+            f"Warning: Parsed value in column '{column_name}' is not a list: {error_msg}"
+        )
+    except ValueError:
+        error_msg = value[:max_length] + "..." if len(value) > max_length else value
+        reporter.on_message(
+            f"Warning: Could not parse vector in column '{column_name}': {error_msg}"
+        )
+    return None
+
+
+def parse_vector_column(*, df: pd.DataFrame, column: str, reporter: IReporter) -> None:
+    """Parse a column of JSON-encoded vectors in place.
+
+    Fast path: join every cell into one big JSON array and decode it with
+    a single orjson call, so the whole column is parsed in native code
+    instead of once per cell. Any missing or malformed cell drops the
+    column back to the per-cell parser, which reports warnings per row.
+    """
+    if column not in df.columns:
+        reporter.on_message(
+            f"Warning: Column '{column}' not found in DataFrame. Skipping transformation."
+        )
+        return
+
+    series = df[column]
+    if orjson is not None and not series.isna().any():
+        try:
+            parsed = orjson.loads("[" + ",".join(series.astype(str)) + "]")
+        except (orjson.JSONDecodeError, TypeError):
+            parsed = None
+        # The joined decode can change the element count (e.g. a cell like
+        # "[1],[2]" contributes two elements), so the length check keeps a
+        # malformed column from being assigned and raising in pandas; the
+        # per-element validation matches what the per-cell parser enforces
+        if (
+            parsed is not None
+            and len(parsed) == len(series)
+            and all(is_vector_embedding(value) for value in parsed)
+        ):
+            df[column] = parsed
+            reporter.on_message(f"Transformed column '{column}' from string to array format")
+            return
+
+    def parse_cell(value: object) -> list[float] | None:
+        if pd.isna(value):
+            return None
+        return parse_vector(str(value), column, reporter)
+
+    df[column] = series.apply(parse_cell)
+    reporter.on_message(f"Transformed column '{column}' from string to array format")
@@ -1,21 +1,12 @@
-import asyncio
-import contextlib
 import sys
-import traceback
 from typing import Any
 
-from lib.bedrock import (
-    BedrockClient,
-    EmbeddingModelId,
-    EmbeddingType,
-    EmbeddingVector,
-    InvokeEmbeddingModelCommand,
-    InvokeModelCommand,
-)
+from apps.cli.utils import build_parser
 from lib.console_reporter import ConsoleReporter
-from lib.opensearch.client import OpenSearchClient
-from lib.search_and_rerank import search_and_rerank
-from lib.utils import get_aws_credentials
+
+# lib.bedrock (and with it aiohttp/aioboto3) is imported lazily inside
+# main() so that loading this module for argparse registration does not
+# pay the Bedrock import cost on every CLI invocation
 
 DEFINITION = {
     "name": "search",
@@ -78,6 +69,13 @@ DEFINITION = {
             "default": 9200,
             "help": "OpenSearch port (default: 9200)",
         },
+        {
+            "name": "pool-maxsize",
+            "type": int,
+            "required": False,
+            "default": 32,
+            "help": "Maximum HTTP connection pool size for OpenSearch (default: 32)",
+        },
         {
             "name": "profile",
             "type": str,
@@ -106,6 +104,22 @@ DEFINITION = {
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
+
+def build_filters(
+    filter_field: str | None,
+    filter_value: str | None,
+) -> list[dict[str, Any]] | None:
+    """Build the term-filter clause once so every query layer reuses the same list.
+
+    Returns None when no filter is configured, matching what
+    search_and_rerank expects.
+    """
+    if filter_field and filter_value:
+        return [{"term": {f"{filter_field}.keyword": filter_value}}]
+    return None
+
 
 def main(
     *,
@@ -118,6 +132,7 @@ def main(
     index: str,
     opensearch_host: str = "localhost",
     opensearch_port: int = 9200,
+    pool_maxsize: int = 32,
     profile: str | None = None,
     query: str,
     region: str = "us-east-1",
@@ -126,6 +141,9 @@ def main(
     """
     Main entry point for the search command.
 
+    Runs the whole command (embedding, search, rerank, client close) on a
+    single event loop so the Bedrock HTTP pool survives across steps.
+
     Args:
         assume_role: AWS role to assume for OpenSearch operations
         bedrock_model_id: Bedrock model ID to use
@@ -136,11 +154,88 @@ def main(
         index: Index name to use
         opensearch_host: OpenSearch host
         opensearch_port: OpenSearch port
+        pool_maxsize: Maximum HTTP connection pool size for OpenSearch
         profile: AWS profile to use
         query: Query to search
         region: AWS region
         vector_dimension: Vector dimension for embeddings
     """
+    import asyncio
+
+    asyncio.run(
+        _amain(
+            assume_role=assume_role,
+            bedrock_model_id=bedrock_model_id,
+            column=column,
+            embedding_column_suffix=embedding_column_suffix,
+            filter_field=filter_field,
+            filter_value=filter_value,
+            index=index,
+            opensearch_host=opensearch_host,
+            opensearch_port=opensearch_port,
+            pool_maxsize=pool_maxsize,
+            profile=profile,
+            query=query,
+            region=region,
+            vector_dimension=vector_dimension,
+        )
+    )
+
+
+async def _amain(  # noqa: PLR0913, PLR0915, C901
+    *,
+    assume_role: str | None = None,
+    bedrock_model_id: str,
+    column: str,
+    embedding_column_suffix: str = "_embedding",
+    filter_field: str | None = None,
+    filter_value: str | None = None,
+    index: str,
+    opensearch_host: str = "localhost",
+    opensearch_port: int = 9200,
+    pool_maxsize: int = 32,
+    profile: str | None = None,
+    query: str,
+    region: str = "us-east-1",
+    vector_dimension: int,
+) -> None:
+    """
+    Async implementation of the search command.
+
+    Args:
+        assume_role: AWS role to assume for OpenSearch operations
+        bedrock_model_id: Bedrock model ID to use
+        column: Column to search on
+        embedding_column_suffix: Suffix appended to column names for embedding columns (default: _embedding)
+        filter_field: Field name for filtering search results
+        filter_value: Value for filtering search results
+        index: Index name to use
+        opensearch_host: OpenSearch host
+        opensearch_port: OpenSearch port
+        pool_maxsize: Maximum HTTP connection pool size for OpenSearch
+        profile: AWS profile to use
+        query: Query to search
+        region: AWS region
+        vector_dimension: Vector dimension for embeddings
+    """
+    import contextlib
+    import hashlib
+    from pathlib import Path
+
+    import numpy as np
+
+    from lib.bedrock import (
+        BedrockClient,
+        EmbeddingModelId,
+        EmbeddingType,
+        EmbeddingVector,
+        InvokeEmbeddingModelCommand,
+        InvokeModelCommand,
+    )
+    from lib.opensearch.client import OpenSearchClient
+    from lib.search_and_rerank import search_and_rerank
+    from lib.utils import get_aws_credentials
+
     reporter = ConsoleReporter()
 
     # Validate inputs
@@ -159,15 +254,14 @@ def main(
     opensearch = OpenSearchClient(
         credentials=credentials,
         host=opensearch_host,
+        pool_maxsize=pool_maxsize,
         port=opensearch_port,
         region=region,
         reporter=reporter,
     )
 
     # Build filters from arguments if provided
-    filters: list[dict[str, Any]] = []
-    if filter_field and filter_value:
-        filters.append({"term": {f"{filter_field}.keyword": filter_value}})
+    filters = build_filters(filter_field, filter_value)
 
     # Print header
     reporter.on_message("=" * 80)
@@ -184,20 +278,39 @@ def main(
             InvokeModelCommand(client=bedrock_client)
         )
 
+        # Repeated identical queries skip the Bedrock round-trip entirely:
+        # embeddings are cached on disk keyed by model, dimension and query
+        cache_dir = Path.home() / ".cache" / "semantic-entity-matching" / "embeddings"
+        query_hash = hashlib.sha256(query.encode()).hexdigest()
+        cache_path = cache_dir / f"{bedrock_model_id}.{vector_dimension}.{query_hash}.npy"
+
         async def get_embedding() -> EmbeddingVector:
+            if cache_path.exists():
+                try:
+                    return np.load(cache_path)
+                except (OSError, ValueError):
+                    pass
+
             results = await invoke_embedding_model_command.execute(
                 inputs=[query],
                 model_id=EmbeddingModelId(bedrock_model_id),
                 embedding_types=[EmbeddingType.FLOAT],
                 output_dimension=vector_dimension,
             )
-            return results[0].embeddings[EmbeddingType.FLOAT]
+            embedding = results[0].embeddings[EmbeddingType.FLOAT]
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                np.save(cache_path, embedding)
+            except OSError:
+                # Caching is an optimization; never fail the search over it
+                pass
+            return embedding
 
-        results = search_and_rerank(
+        results = await search_and_rerank(
             column=column,
             embedding_column_suffix=embedding_column_suffix,
             get_embedding=get_embedding,
-            filters=filters if filters else None,
+            filters=filters,
             index=index,
             opensearch=opensearch,
             profile=profile,
@@ -208,12 +321,15 @@ def main(
         )
     except Exception as e:
         reporter.on_message(f"Error during search: {e}")
-        reporter.on_message(traceback.format_exc())
+        # Imported only on the failure path, matching evaluate.py
+        import traceback
+
+        reporter.on_message("".join(traceback.format_exception(e, limit=-5)))
         sys.exit(1)
     finally:
         # Ensure BedrockClient is properly closed to clean up aiohttp connections
         with contextlib.suppress(Exception):
-            asyncio.run(bedrock_client.close())
+            await bedrock_client.close()
 
     # Extract results
     search_results = results["search_results"]
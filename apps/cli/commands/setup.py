@@ -3,6 +3,7 @@ import traceback
 
 from opensearchpy.exceptions import TransportError
 
+from apps.cli.utils import build_parser
 from lib.console_reporter import ConsoleReporter
 from lib.interfaces import IReporter
 from lib.opensearch.client import OpenSearchClient
@@ -26,6 +27,14 @@ DEFINITION = {
             "required": True,
             "help": "List of columns to use for ingestion",
         },
+        {
+            "name": "concurrent-segment-search-mode",
+            "type": str,
+            "required": False,
+            "default": "auto",
+            "choices": ["all", "auto", "none"],
+            "help": "Cluster-level concurrent segment search mode; speeds up kNN queries on multi-segment indices at higher data-node CPU cost (default: auto)",
+        },
         {
             "name": "delete",
             "action": "store_true",
@@ -93,6 +102,13 @@ DEFINITION = {
             "default": 9200,
             "help": "OpenSearch port (default: 9200)",
         },
+        {
+            "name": "pool-maxsize",
+            "type": int,
+            "required": False,
+            "default": 32,
+            "help": "Maximum HTTP connection pool size for OpenSearch (default: 32)",
+        },
         {
             "name": "profile",
             "type": str,
@@ -123,6 +139,8 @@ DEFINITION = {
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
 
 def confirm(prompt: str, *, reporter: IReporter) -> None:
     """Prompt user for confirmation."""
@@ -138,6 +156,7 @@ def main(
     *,
     assume_role: str | None = None,
     columns: list[str],
+    concurrent_segment_search_mode: str = "auto",
     delete: bool = False,
     ef_construction: int = 512,
     ef_search: int = 512,
@@ -148,6 +167,7 @@ def main(
     no_confirm: bool = False,
     opensearch_host: str = "localhost",
     opensearch_port: int = 9200,
+    pool_maxsize: int = 32,
     profile: str | None = None,
     region: str = "us-east-1",
     space_type: str = "l2",
@@ -159,6 +179,7 @@ def main(
     Args:
         assume_role: AWS role to assume for OpenSearch operations
         columns: List of columns to use for ingestion
+        concurrent_segment_search_mode: Cluster-level concurrent segment search mode
         delete: Delete existing index before setup
         ef_construction: HNSW ef_construction parameter for index creation
         ef_search: HNSW ef_search parameter for index creation
@@ -169,6 +190,7 @@ def main(
         no_confirm: Skip confirmation prompts
         opensearch_host: OpenSearch host
         opensearch_port: OpenSearch port
+        pool_maxsize: Maximum HTTP connection pool size for OpenSearch
         profile: AWS profile to use
         region: AWS region
         space_type: Space type for vector similarity
@@ -187,6 +209,7 @@ def main(
     opensearch = OpenSearchClient(
         credentials=credentials,
         host=opensearch_host,
+        pool_maxsize=pool_maxsize,
         port=opensearch_port,
         region=region,
         reporter=reporter,
@@ -213,8 +236,9 @@ Please confirm if you want to proceed.""",
 
     # Call the library function for business logic
     try:
-        setup_opensearch(
+        result = setup_opensearch(
             columns=columns,
+            concurrent_segment_search_mode=concurrent_segment_search_mode,
             delete=delete,
             ef_construction=ef_construction,
             ef_search=ef_search,
@@ -227,8 +251,9 @@ Please confirm if you want to proceed.""",
             vector_dimension=vector_dimension,
         )
 
-        # Check if index already exists (for user feedback)
-        if not delete and opensearch.index_exists(index=index):
+        # The setup result already knows whether the index pre-existed,
+        # so user feedback needs no extra round trip to the cluster
+        if not delete and result.existed:
             reporter.on_message(
                 f"Index {index} already exists, skipping. (use --delete to delete and recreate)"
             )
@@ -243,5 +268,5 @@ Please confirm if you want to proceed.""",
         sys.exit(1)
     except Exception as e:
         reporter.on_message(f"Unexpected error: {e}")
-        reporter.on_message(traceback.format_exc())
+        reporter.on_message("".join(traceback.format_exception(e, limit=-5)))
         sys.exit(1)
@@ -2,6 +2,7 @@ import os
 import sys
 from pathlib import Path
 
+from apps.cli.utils import build_parser
 from lib.file_token_estimation import FileTokenEstimator
 
 DEFINITION = {
@@ -17,6 +18,8 @@ DEFINITION = {
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
 
 def main(
     *,
@@ -2,17 +2,22 @@
 CLI command for vectorizing CSV/Excel files using AWS Bedrock embeddings.
 """
 
-import asyncio
+import csv
 import os
 import sys
 import traceback
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
+import numpy as np
+import orjson
+import pandas as pd
+
+from apps.cli.utils import build_parser
 from lib.bedrock import BedrockClient, EmbeddingType
 from lib.console_reporter import ConsoleReporter
 from lib.data_reader import DataReader
-from lib.vectorize_columns import vectorize_columns
+from lib.vectorize_columns import get_event_loop, iter_vectorized_batches
 
 DEFINITION = {
     "name": "vectorize",
@@ -50,6 +55,13 @@ DEFINITION = {
             "default": 5,
             "help": "Maximum number of retry attempts for failed batches (default: 5)",
         },
+        {
+            "name": "num-workers",
+            "type": int,
+            "required": False,
+            "default": 100,
+            "help": "Number of concurrent Bedrock requests (default: 100); lower this to stay inside model TPM quotas",
+        },
         {
             "name": "output",
             "type": str,
@@ -104,18 +116,41 @@ DEFINITION = {
             "default": "_embedding",
             "help": "Suffix to append to column names for embedding columns (default: _embedding)",
         },
+        {
+            "name": "embedding-type",
+            "type": str,
+            "required": False,
+            "default": "float",
+            "choices": [embedding_type.value for embedding_type in EmbeddingType],
+            "help": "Embedding type to request (default: float); int8 cuts payload and memory 4x on models that support it, but the target index must use a matching vector type",
+        },
     ],
 }
 
+PARSER = build_parser(DEFINITION)
+
+
+def _csv_cell(value: Any) -> Any:
+    """Encode one DataFrame cell for csv.writer; embeddings become JSON text."""
+    if isinstance(value, np.ndarray):
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    if isinstance(value, list):
+        return orjson.dumps(value).decode()
+    if pd.isna(value):
+        return ""
+    return value
+
 
 def main(
     *,
     bedrock_model_id: str,
     columns: list[str],
     embedding_column_suffix: str,
+    embedding_type: str = "float",
     file: str,
     limit_rows: int | None = None,
     max_attempts: int = 3,
+    num_workers: int = 100,
     output: str | None = None,
     overwrite: bool = False,
     profile: str | None = None,
@@ -131,9 +166,11 @@ def main(
         bedrock_model_id: AWS Bedrock model ID for embeddings
         columns: List of column names to vectorize
         embedding_column_suffix: Suffix to append to column names for embedding columns
+        embedding_type: Embedding type to request ("float", "int8", "uint8", "binary", "ubinary")
         file: Path to input CSV or Excel file
         limit_rows: Optional limit on number of rows to process
         max_attempts: Maximum number of retry attempts for failed batches
+        num_workers: Number of concurrent Bedrock requests
         output: Custom output file path
         overwrite: Automatically overwrite existing output file without prompting
         profile: AWS profile to use
@@ -162,14 +199,15 @@ def main(
         output_path = str(input_path.parent / f"{input_path.stem}_vectorized{'.csv'}")
 
     # Check if output file exists and prompt for overwrite (unless --overwrite flag is set)
-    if os.path.exists(output_path) and not overwrite:
+    output_exists = os.path.exists(output_path)
+    if output_exists and not overwrite:
         response = reporter.on_input(
             f"Output file already exists: {output_path}\nOverwrite? (y/n): "
         )
         if response.lower() != "y":
             reporter.on_message("Aborting.")
             sys.exit(1)
-    elif os.path.exists(output_path) and overwrite:
+    elif output_exists and overwrite:
         reporter.on_message(f"Output file already exists: {output_path}")
         reporter.on_message("Overwriting (--overwrite flag set)...")
 
@@ -181,75 +219,87 @@ def main(
     reporter.on_message(f"Vector dimension: {vector_dimension}")
     reporter.on_message("")
 
-    # Create Bedrock client
-    client = BedrockClient(profile=profile, region=region)
-
-    try:
-        # Read the data file
-        df = DataReader(
-            file_path=file,
-            limit_rows=limit_rows,
-            skip_rows=skip_rows,
-            reporter=reporter,
-        ).df
-
-        # Vectorize columns
-        result_df = vectorize_columns(
-            bedrock_model_id=bedrock_model_id,
-            client=client,
-            columns=columns,
-            df=df,
-            embedding_column_suffix=embedding_column_suffix,
-            embedding_type=EmbeddingType.FLOAT,
-            max_attempts=max_attempts,
-            output_dimension=vector_dimension,
-            reporter=reporter,
-            strategy=vectorize_strategy,
-        )
-
-        # Write output to CSV
-        reporter.on_message(f"\nWriting output to: {output_path}")
-        result_df.to_csv(output_path, index=False)
-        reporter.on_message(f"Successfully wrote {len(result_df)} rows to {output_path}")
-
-        # Report on embedding columns
-        if vectorize_strategy == "per-column":
-            embedding_cols = [f"{col}{embedding_column_suffix}" for col in columns]
-        else:
-            # Column name is concatenation of column names with suffix
-            embedding_cols = ["_".join(columns) + embedding_column_suffix]
-
-        reporter.on_message(f"\nEmbedding columns created: {embedding_cols}")
-
-        # Check for null embeddings
-        for col in embedding_cols:
-            null_count = result_df[col].isna().sum()
-            if null_count > 0:
-                reporter.on_message(
-                    f"Warning: {null_count} rows have null values in {col} (check error logs)"
-                )
-
-    except ValueError as e:
-        reporter.on_message(f"Error: {e}")
-        sys.exit(1)
-    except Exception as e:
-        reporter.on_message(f"Unexpected error: {e}")
-        reporter.on_message(traceback.format_exc())
-        sys.exit(1)
-    finally:
-        # Clean up client connections
-        # Check if there's a running event loop to avoid errors during Ctrl+C
+    # Create Bedrock client; the context manager owns connection cleanup
+    with BedrockClient(profile=profile, region=region) as client:
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # No running loop, safe to use asyncio.run()
-            asyncio.run(client.close())
-        else:
-            # Loop is running (shouldn't happen here, but handle gracefully)
-            # Create a new event loop for cleanup
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(client.close())
-            finally:
-                loop.close()
+            # Build the runtime client before touching the data so the
+            # first embedding batch does not pay the cold-start cost; the
+            # warmup runs on the same loop the batches use, otherwise the
+            # warmed client would be discarded on the first loop change
+            get_event_loop().run_until_complete(client.warmup())
+
+            # Read the data file
+            df = DataReader(
+                file_path=file,
+                limit_rows=limit_rows,
+                skip_rows=skip_rows,
+                reporter=reporter,
+            ).df
+
+            # Determine embedding column names up front
+            if vectorize_strategy == "per-column":
+                embedding_cols = [f"{col}{embedding_column_suffix}" for col in columns]
+            else:
+                # Column name is concatenation of column names with suffix
+                embedding_cols = ["_".join(columns) + embedding_column_suffix]
+
+            null_counts = dict.fromkeys(embedding_cols, 0)
+            rows_written = 0
+
+            # Stream each embedded batch straight to disk so peak memory holds
+            # one batch of embeddings instead of the whole result DataFrame
+            # Write to a temp file next to the target and rename once done:
+            # an interrupted run never leaves a truncated CSV at output_path
+            temp_output_path = output_path + ".tmp"
+            reporter.on_message(f"\nWriting output to: {output_path}")
+            with open(temp_output_path, "w", newline="", buffering=1 << 20) as output_file:
+                writer = csv.writer(output_file)
+                header_written = False
+
+                for batch_df in iter_vectorized_batches(
+                    bedrock_model_id=bedrock_model_id,
+                    client=client,
+                    columns=columns,
+                    df=df,
+                    embedding_column_suffix=embedding_column_suffix,
+                    embedding_type=EmbeddingType(embedding_type),
+                    max_attempts=max_attempts,
+                    num_workers=num_workers,
+                    output_dimension=vector_dimension,
+                    reporter=reporter,
+                    strategy=vectorize_strategy,
+                ):
+                    if not header_written:
+                        writer.writerow(batch_df.columns)
+                        header_written = True
+                    writer.writerows(
+                        [_csv_cell(value) for value in row]
+                        for row in batch_df.itertuples(index=False, name=None)
+                    )
+                    rows_written += len(batch_df)
+                    for col in embedding_cols:
+                        null_counts[col] += int(batch_df[col].isna().sum())
+
+                if not header_written:
+                    # Empty input still gets a header so the output stays loadable
+                    writer.writerow([*df.columns, *embedding_cols])
+
+            os.replace(temp_output_path, output_path)
+            reporter.on_message(f"Successfully wrote {rows_written} rows to {output_path}")
+
+            reporter.on_message(f"\nEmbedding columns created: {embedding_cols}")
+
+            # Check for null embeddings
+            for col, null_count in null_counts.items():
+                if null_count > 0:
+                    reporter.on_message(
+                        f"Warning: {null_count} rows have null values in {col} (check error logs)"
+                    )
+
+        except ValueError as e:
+            reporter.on_message(f"Error: {e}")
+            sys.exit(1)
+        except Exception as e:
+            reporter.on_message(f"Unexpected error: {e}")
+            reporter.on_message("".join(traceback.format_exception(e, limit=-5)))
+            sys.exit(1)
@@ -1,21 +1,26 @@
 import argparse
+import importlib
 import signal
 import sys
 from typing import Any
 
+from apps.cli.utils import build_parser
 from lib.logging import LogLevel, setup_logging
 
-from .commands import dev, evaluate, ingest, search, setup, tokens, vectorize
-
-COMMANDS = [
-    dev,
-    evaluate,
-    ingest,
-    search,
-    setup,
-    tokens,
-    vectorize,
-]
+# Command modules are imported lazily: loading all of them pulls pandas,
+# boto3 and opensearch-py into every invocation, so a normal run imports
+# only the requested command. The descriptions here let top-level help
+# render without importing anything; keep them in sync with each
+# command's DEFINITION.
+COMMAND_DESCRIPTIONS = {
+    "dev": "Interactive OpenSearch request console",
+    "evaluate": "Evaluate search performance against test dataset",
+    "ingest": "Ingest data from file",
+    "search": "Search data",
+    "setup": "Setup OpenSearch ML connector and document index",
+    "tokens": "Estimate token count for a file using tiktoken",
+    "vectorize": "Generate embeddings for columns in a CSV or Excel file",
+}
 
 COMMON_ARGUMENTS = [
     {
@@ -35,6 +40,9 @@ COMMON_ARGUMENTS = [
     },
 ]
 
+# Compiled once at import; every subparser attaches this as a parent
+COMMON_PARSER = build_parser({"arguments": COMMON_ARGUMENTS})
+
 
 def signal_handler(sig: int, _: Any) -> None:
     """
@@ -52,6 +60,8 @@ def validate_command_import(command):
         raise ValueError(f"Command {command} does not have DEFINITION")
     if not isinstance(command.DEFINITION, dict):
         raise ValueError(f"Command {command} DEFINITION is not a dictionary")
+    if not hasattr(command, "PARSER"):
+        raise ValueError(f"Command {command} does not have PARSER")
 
     if not hasattr(command, "main"):
         raise ValueError(f"Command {command} DEFINITION does not have main function")
@@ -66,10 +76,53 @@ def validate_command_import(command):
     return True
 
 
+def print_static_help() -> None:
+    """Print top-level help from the manifest, without importing commands."""
+    command_list = ",".join(COMMAND_DESCRIPTIONS)
+    print(f"usage: main.py [-h] {{{command_list}}} ...")
+    print()
+    print("OpenSearch CLI tool for data ingestion and search")
+    print()
+    print("positional arguments:")
+    print(f"  {{{command_list}}}")
+    print("                        Available commands")
+    for name, description in COMMAND_DESCRIPTIONS.items():
+        print(f"    {name:<20}{description}")
+    print()
+    print("options:")
+    print("  -h, --help            show this help message and exit")
+
+
+def load_command(name: str):
+    """Import and validate a single command module."""
+    command = importlib.import_module(f"apps.cli.commands.{name}")
+    validate_command_import(command)
+    # Precomputed once so dispatch can filter parsed args with a single
+    # C-level set intersection instead of per-key membership tests
+    command._valid_kwargs = frozenset(
+        arg["name"].replace("-", "_") for arg in command.DEFINITION["arguments"]
+    )
+    return command
+
+
 if __name__ == "__main__":
     # Set up signal handler for graceful interruption
     signal.signal(signal.SIGINT, signal_handler)
 
+    # Top-level help never needs the command modules, so answer it before
+    # paying any import cost
+    if len(sys.argv) <= 1 or sys.argv[1] in ("-h", "--help"):
+        print_static_help()
+        sys.exit(0)
+
+    # Import only the requested command when one is named; anything else
+    # (typos, unknown commands) needs the full set for argparse errors
+    requested = sys.argv[1]
+    if requested in COMMAND_DESCRIPTIONS:
+        commands_by_name = {requested: load_command(requested)}
+    else:
+        commands_by_name = {name: load_command(name) for name in COMMAND_DESCRIPTIONS}
+
     parser = argparse.ArgumentParser(
         description="OpenSearch CLI tool for data ingestion and search"
     )
@@ -77,29 +130,17 @@ if __name__ == "__main__":
     # Add subparsers for commands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    for command in COMMANDS:
-        validate_command_import(command)
-
-        # Create subparser for this command
-        command_parser = subparsers.add_parser(
+    # Each command module pre-builds its own PARSER at import time, so the
+    # dispatcher only wires parents together instead of re-adding (and
+    # re-sorting) every argument per invocation
+    for command in commands_by_name.values():
+        # Create subparser for this command from the pre-built parsers
+        subparsers.add_parser(
             command.DEFINITION["name"],
             help=command.DEFINITION["description"],
+            parents=[COMMON_PARSER, command.PARSER],
         )
 
-        # Add common arguments and command arguments and sort them alphabetically
-        arguments = sorted(
-            [*COMMON_ARGUMENTS, *command.DEFINITION["arguments"]],
-            key=lambda x: x["name"],
-        )
-
-        # Add arguments to the subparser
-        for argument in arguments:
-            arg_name = argument["name"]
-            # Extract kwargs, excluding "name" which is used for the flag name
-            kwargs = {k: v for k, v in argument.items() if k != "name"}
-            # Add the argument to the subparser
-            command_parser.add_argument(f"--{arg_name}", **kwargs)
-
     args = parser.parse_args()
 
     # Setup logging based on CLI arguments
@@ -109,12 +150,7 @@ if __name__ == "__main__":
         parser.print_help()
         sys.exit(0)
 
-    for command in COMMANDS:
-        if args.command == command.DEFINITION["name"]:
-            valid_argument_names = [
-                arg["name"].replace("-", "_") for arg in command.DEFINITION["arguments"]
-            ]
-            command.main(
-                **{key: value for key, value in vars(args).items() if key in valid_argument_names}
-            )
-            sys.exit(0)
+    command = commands_by_name[args.command]
+    args_dict = vars(args)
+    command.main(**{key: args_dict[key] for key in command._valid_kwargs & args_dict.keys()})
+    sys.exit(0)
@@ -2,8 +2,11 @@
 Utility functions for the OpenSearch CLI tool.
 """
 
+import argparse
 from typing import Any, TypeGuard
 
+import numpy as np
+
 
 def is_list(value: Any) -> TypeGuard[list[Any]]:
     """Check if a value is a list."""
@@ -11,8 +14,21 @@ def is_list(value: Any) -> TypeGuard[list[Any]]:
 
 
 def is_vector_embedding(value: Any) -> TypeGuard[list[float]]:
-    """Check if a value is a vector embedding."""
-    return is_list(value) and all(isinstance(item, float) for item in value)
+    """Check if a value is a vector embedding.
+
+    A single numpy conversion validates the whole vector in native code;
+    checking the resulting dtype replaces one isinstance call per element,
+    which adds up fast for wide embedding columns.
+    """
+    if isinstance(value, np.ndarray):
+        return value.ndim == 1 and value.dtype.kind == "f"
+    if not is_list(value):
+        return False
+    try:
+        arr = np.asarray(value)
+    except ValueError:  # ragged nested lists
+        return False
+    return arr.ndim == 1 and arr.dtype.kind == "f"
 
 
 def build_pipeline_name(*, base_name: str, index_name: str, column: str | None = None) -> str:
@@ -30,3 +46,18 @@ def build_pipeline_name(*, base_name: str, index_name: str, column: str | None =
     if column:
         return f"{base_name}-{index_name}-{column}"
     return f"{base_name}-{index_name}"
+
+
+def build_parser(definition: dict[str, Any]) -> argparse.ArgumentParser:
+    """Build a reusable argument parser from a command DEFINITION.
+
+    Commands call this once at import time so the CLI dispatcher can
+    attach the result as a parent parser instead of re-adding every
+    argument on each invocation.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    for argument in sorted(definition["arguments"], key=lambda x: x["name"]):
+        # Extract kwargs, excluding "name" which is used for the flag name
+        kwargs = {k: v for k, v in argument.items() if k != "name"}
+        parser.add_argument(f"--{argument['name']}", **kwargs)
+    return parser
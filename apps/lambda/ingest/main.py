@@ -1,13 +1,116 @@
+import io
 import json
 import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from urllib.parse import urlparse
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 
+from lib.data_reader import DataReader, FileFormat
 from lib.ingest import ingest
+from lib.null_reporter import NullReporter
 from lib.opensearch.client import OpenSearchClient
 
+# Warm Lambda containers keep module state between invocations, so caching
+# clients here reuses resolved endpoints and keep-alive TLS connections
+# instead of paying connection setup on every invocation
+# Concurrent range-GETs saturate the Lambda NIC on large objects instead
+# of pulling the whole file down a single TCP stream
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+)
+
+_CLIENTS_LOCK = threading.Lock()
+_S3_CLIENTS: dict[str, Any] = {}
+_OS_CLIENTS: dict[tuple[str, str], OpenSearchClient] = {}
+
+
+def _get_s3_client(region: str) -> Any:
+    """Return a cached S3 client for the region, creating it on first use."""
+    with _CLIENTS_LOCK:
+        if region not in _S3_CLIENTS:
+            _S3_CLIENTS[region] = boto3.client("s3", region_name=region)
+        return _S3_CLIENTS[region]
+
+
+def _get_opensearch_client(*, endpoint: str, pool_maxsize: int, region: str) -> OpenSearchClient:
+    """Return a cached OpenSearch client for the endpoint, creating it on first use."""
+    key = (endpoint, region)
+    with _CLIENTS_LOCK:
+        if key not in _OS_CLIENTS:
+            _OS_CLIENTS[key] = OpenSearchClient(
+                host=endpoint,
+                pool_maxsize=pool_maxsize,
+                region=region,
+                reporter=NullReporter(),
+            )
+        return _OS_CLIENTS[key]
+
+
+def _parse_s3_uri(s3_uri: str) -> tuple[str, str]:
+    """Split an s3:// URI into (bucket, key), validating both parts."""
+    parsed_uri = urlparse(s3_uri)
+    if parsed_uri.scheme != "s3":
+        raise ValueError("Invalid S3 URI format. Expected s3://bucket/key")
+
+    bucket_name = parsed_uri.netloc
+    object_key = parsed_uri.path.lstrip("/")
+
+    if not bucket_name or not object_key:
+        raise ValueError("Invalid S3 URI. Both bucket and key are required")
+    return bucket_name, object_key
+
+
+def _read_s3_object(
+    *,
+    limit_rows: int | None,
+    reporter: NullReporter,
+    s3_client: Any,
+    s3_uri: str,
+    skip_rows: int,
+) -> DataReader:
+    """Fetch one S3 object and parse it into a DataReader."""
+    bucket_name, object_key = _parse_s3_uri(s3_uri)
+    suffix = os.path.splitext(object_key)[1].lower()
+
+    if suffix == ".csv":
+        # CSV parses sequentially, so pipe the S3 body straight into
+        # pandas: half the bytes moved and no /tmp ceiling to hit
+        print(f"Streaming file from S3: {s3_uri}")
+        s3_body = s3_client.get_object(Bucket=bucket_name, Key=object_key)["Body"]
+        return DataReader.from_stream(
+            file_format=FileFormat.CSV,
+            fileobj=io.TextIOWrapper(s3_body, encoding="utf-8"),
+            limit_rows=limit_rows,
+            reporter=reporter,
+            skip_rows=skip_rows,
+        )
+
+    # Excel needs a seekable file, so keep the temp-file path here
+    print(f"Downloading file from S3: {s3_uri}")
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        temp_file_path = temp_file.name
+    try:
+        s3_client.download_file(bucket_name, object_key, temp_file_path, Config=_TRANSFER_CONFIG)
+        print(f"File downloaded successfully to: {temp_file_path}")
+        return DataReader(
+            file_path=temp_file_path,
+            limit_rows=limit_rows,
+            reporter=reporter,
+            skip_rows=skip_rows,
+        )
+    finally:
+        # Clean up temporary file
+        if os.path.exists(temp_file_path):
+            os.unlink(temp_file_path)
+            print(f"Cleaned up temporary file: {temp_file_path}")
+
 
 def lambda_handler(event, context):
     """
@@ -16,21 +119,24 @@ def lambda_handler(event, context):
     Expected event structure:
     {
         "s3_uri": "s3://bucket-name/path/to/file.csv",
+        "s3_uris": ["s3://bucket-name/a.csv", ...],  # alternative to s3_uri
         "opensearch_endpoint": "https://your-opensearch-domain.region.es.amazonaws.com",
         "index_name": "your-index",
         "pipeline_name": "embedding-pipeline",  # optional
         "region": "us-east-1",
-        "limit_rows": 1000,  # optional
-        "delete": false,  # optional
-        "batch_size": 50,  # optional, number of documents per batch
-        "wait_time": 5.0,  # optional, wait time in seconds between batches
+        "limit_rows": 1000,  # optional, applied per file
+        "delete": false,  # optional, applied before the first file only
+        "batch_size": 50,  # optional, sizes the OpenSearch connection pool
         "max_attempts": 5,  # optional, maximum retry attempts
-        "skip_rows": 0,  # optional, number of rows to skip
+        "skip_rows": 0,  # optional, number of rows to skip per file
     }
     """
     try:
-        # Parse event parameters
-        s3_uri = event.get("s3_uri")
+        # Parse event parameters; s3_uris amortizes warm-start and client
+        # setup across a whole batch of files in a single invocation
+        s3_uris = event.get("s3_uris")
+        if s3_uris is None and event.get("s3_uri"):
+            s3_uris = [event["s3_uri"]]
         opensearch_endpoint = event.get("opensearch_endpoint")
         index_name = event.get("index_name")
         pipeline_name = event.get("pipeline_name", "nlp-ingest-pipeline")
@@ -38,80 +144,81 @@ def lambda_handler(event, context):
         limit_rows = event.get("limit_rows")
         delete = event.get("delete", False)
         batch_size = event.get("batch_size", 50)
-        wait_time = event.get("wait_time", 5.0)
         max_attempts = event.get("max_attempts", 5)
         skip_rows = event.get("skip_rows", 0)
 
         # Validate required parameters
-        if not s3_uri:
-            raise ValueError("s3_uri is required")
+        if not s3_uris:
+            raise ValueError("s3_uri or s3_uris is required")
         if not opensearch_endpoint:
             raise ValueError("opensearch_endpoint is required")
         if not index_name:
             raise ValueError("index_name is required")
 
-        # Parse S3 URI
-        parsed_uri = urlparse(s3_uri)
-        if parsed_uri.scheme != "s3":
-            raise ValueError("Invalid S3 URI format. Expected s3://bucket/key")
-
-        bucket_name = parsed_uri.netloc
-        object_key = parsed_uri.path.lstrip("/")
-
-        if not bucket_name or not object_key:
-            raise ValueError("Invalid S3 URI. Both bucket and key are required")
-
-        # Download file from S3
-        print(f"Downloading file from S3: {s3_uri}")
-        s3_client = boto3.client("s3", region_name=region)
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=os.path.splitext(object_key)[1]
-        ) as temp_file:
-            temp_file_path = temp_file.name
-
-        try:
-            # Download the file
-            s3_client.download_file(bucket_name, object_key, temp_file_path)
-            print(f"File downloaded successfully to: {temp_file_path}")
+        # Fail fast on any malformed URI before fetching anything
+        for s3_uri in s3_uris:
+            _parse_s3_uri(s3_uri)
+
+        s3_client = _get_s3_client(region)
+        reporter = NullReporter()
+
+        # OpenSearch client init (DNS lookup, TLS handshake) is independent
+        # of the S3 fetch, so run it in the background and overlap it with
+        # the downloads instead of paying it serially afterwards.
+        # Size the connection pool to the batch fan-out so bulk requests
+        # reuse keep-alive TLS connections
+        executor = ThreadPoolExecutor(max_workers=1)
+        opensearch_future = executor.submit(
+            _get_opensearch_client,
+            endpoint=opensearch_endpoint,
+            pool_maxsize=max(32, batch_size),
+            region=region,
+        )
+        executor.shutdown(wait=False)
+
+        # Fetch and parse every file concurrently so S3 bandwidth overlaps
+        with ThreadPoolExecutor(max_workers=min(10, len(s3_uris))) as download_pool:
+            readers = list(
+                download_pool.map(
+                    lambda s3_uri: _read_s3_object(
+                        limit_rows=limit_rows,
+                        reporter=reporter,
+                        s3_client=s3_client,
+                        s3_uri=s3_uri,
+                        skip_rows=skip_rows,
+                    ),
+                    s3_uris,
+                )
+            )
 
-            # Initialize OpenSearch client
-            opensearch = OpenSearchClient(host=opensearch_endpoint, region=region)
+        opensearch = opensearch_future.result()
 
-            # Perform ingest operation
-            print("Starting ingest operation...")
+        # Perform ingest operations; delete only ahead of the first file so
+        # later files append instead of wiping what was just ingested
+        print("Starting ingest operation...")
+        for position, reader in enumerate(readers):
             ingest(
-                batch_size=batch_size,
-                delete=delete,
-                file_path=temp_file_path,
+                delete=delete and position == 0,
+                df=reader.df,
                 index_name=index_name,
-                limit_rows=limit_rows,
                 max_attempts=max_attempts,
                 opensearch=opensearch,
                 pipeline_name=pipeline_name,
-                skip_rows=skip_rows,
-                wait_time=wait_time,
+                reporter=reporter,
             )
 
-            return {
-                "statusCode": 200,
-                "body": json.dumps(
-                    {
-                        "message": "Ingest operation completed successfully",
-                        "s3_uri": s3_uri,
-                        "index_name": index_name,
-                        "pipeline_name": pipeline_name,
-                        "rows_processed": limit_rows if limit_rows else "all",
-                    }
-                ),
-            }
-
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
-                print(f"Cleaned up temporary file: {temp_file_path}")
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "message": "Ingest operation completed successfully",
+                    "s3_uris": s3_uris,
+                    "index_name": index_name,
+                    "pipeline_name": pipeline_name,
+                    "rows_processed": limit_rows if limit_rows else "all",
+                }
+            ),
+        }
 
     except Exception as e:
         print(f"Error in lambda_handler: {e!s}")
@@ -135,7 +242,6 @@ if __name__ == "__main__":
         "region": "us-east-1",
         "s3_uri": "s3://your-bucket/data/sample.csv",
         "skip_rows": 0,
-        "wait_time": 3.0,
     }
 
     result = lambda_handler(test_event, None)
@@ -1,5 +1,7 @@
+import asyncio
 import json
 import sys
+import threading
 from pathlib import Path
 
 
@@ -12,7 +14,6 @@ import streamlit as st  # noqa: E402
 
 from apps.web.utils import WebReporter, get_embedding_callback, get_opensearch_client  # noqa: E402
 from lib.bedrock import BedrockClient # noqa: E402
-from lib.interfaces import SearchAndRerankResults  # noqa: E402
 from lib.opensearch.services import SearchQueryBuilder  # noqa: E402
 from lib.search_and_rerank import search_and_rerank  # noqa: E402
 
@@ -28,24 +29,114 @@ for secret in [
 
 reporter = WebReporter()
 
-bedrock_model_id = st.secrets.get("bedrock_model_id", "us.cohere.embed-v4:0")
+# Read each secret once at module load; reruns re-execute the whole script,
+# so inline st.secrets lookups repeat TOML access on every interaction
+aws_profile = st.secrets.get("aws_profile", None)
 aws_region = st.secrets.get("aws_region", "us-east-1")
+bedrock_model_id = st.secrets.get("bedrock_model_id", "us.cohere.embed-v4:0")
+opensearch_endpoint = st.secrets.get("opensearch_endpoint", "localhost:9200")
 vector_dimension = st.secrets.get("vector_dimension", 1536)
 
-bedrock_client = BedrockClient(region=aws_region)
+@st.cache_resource
+def _get_bedrock_client(*, region: str) -> BedrockClient:
+    """Create the Bedrock client once per process instead of per rerun."""
+    return BedrockClient(region=region)
+
+
+@st.cache_resource
+def _get_search_loop() -> asyncio.AbstractEventLoop:
+    """Create one long-lived event loop for searches.
+
+    asyncio.run() would spin up and close a loop per search, stranding
+    the cached Bedrock client's aiohttp session (which is bound to the
+    loop that created it) and forcing a rebuild on every cache miss.
+    """
+    return asyncio.new_event_loop()
+
+
+# Streamlit runs each session's script on its own thread; serialize
+# access to the shared loop so concurrent sessions can't drive it at once
+_search_loop_lock = threading.Lock()
+
+bedrock_client = _get_bedrock_client(region=aws_region)
 
 # Initialize OpenSearch client
 indices = st.secrets.get("opensearch_indices", [])
 fields = st.secrets.get("opensearch_fields", [])
 
 opensearch = get_opensearch_client(
-    endpoint=st.secrets.get("opensearch_endpoint", "localhost:9200"),
+    endpoint=opensearch_endpoint,
     iam_role=st.secrets.get("opensearch_iam_role", None),
-    profile=st.secrets.get("aws_profile", None),
-    region=st.secrets.get("aws_region", "us-east-1"),
+    profile=aws_profile,
+    region=aws_region,
     _reporter=reporter,
 )
 
+@st.cache_data(show_spinner=False, ttl=600)
+def _run_search(  # noqa: PLR0913
+    *,
+    _bedrock_client: BedrockClient,
+    _opensearch,  # noqa: ANN001
+    bedrock_model_id: str,
+    enable_reranking: bool,
+    fields: tuple[str, ...],
+    index: str,
+    search_query: str,
+    search_type: str,
+    use_embedding_cache: bool,
+    vector_dimension: int,
+) -> list[dict]:
+    """Run one search and return the hits as plain dicts.
+
+    st.cache_data memoizes on the non-underscore keyword arguments, so
+    reruns triggered by unrelated widget interactions skip both the
+    Bedrock embedding call and the OpenSearch query; hits are returned
+    as plain dicts because cache_data requires serializable values.
+
+    Keyword Search probes every selected field in one _msearch request
+    and merges the hits by score; Semantic Search uses the first field.
+    """
+    field = fields[0]
+    if search_type == "Semantic Search":
+        with _search_loop_lock:
+            search_results = _get_search_loop().run_until_complete(
+                search_and_rerank(
+                    column=field,
+                    embedding_column_suffix=field,
+                    enable_reranking=enable_reranking,
+                    filters=[],
+                    index=index,
+                    opensearch=_opensearch,
+                    get_embedding=get_embedding_callback(
+                        bedrock_client=_bedrock_client,
+                        bedrock_model_id=bedrock_model_id,
+                        query=search_query,
+                        use_cache=use_embedding_cache,
+                        vector_dimension=vector_dimension,
+                    ),
+                    profile=aws_profile or "default",
+                    query=search_query,
+                    region=aws_region,
+                    reporter=reporter,
+                )
+            )
+    else:
+        queries = [
+            SearchQueryBuilder(index=index).match(field=keyword_field, value=search_query).build()
+            for keyword_field in fields
+        ]
+        if len(queries) == 1:
+            results = [_opensearch.search.query(queries[0])]
+        else:
+            results = _opensearch.search.multi_query(queries)
+        return sorted(
+            (hit for result in results for hit in result.hits),
+            key=lambda hit: hit["_score"],
+            reverse=True,
+        )
+    return list(search_results["search_results"].hits)
+
+
 # -------------
 # Streamlit app
 # -------------
@@ -66,13 +157,15 @@ with st.sidebar:
         help="Select which index to search against",
     )
 
-    # Field selection
-    field = st.selectbox(
-        label="Search field",
+    # Field selection; Keyword Search probes every selected field in one
+    # _msearch request instead of a round trip per field
+    selected_fields = st.multiselect(
+        label="Search fields",
         options=fields,
-        index=0,
-        help="Select which field to search against",
+        default=fields[:1],
+        help="Select which field(s) to search against; Semantic Search uses the first selection",
     )
+    field = selected_fields[0] if selected_fields else None
 
     # Search type selection
     search_type = st.radio(
@@ -86,6 +179,11 @@ with st.sidebar:
         value=False,
         help="Enable reranking of search results",
     )
+    cache_embeddings = st.checkbox(
+        label="Cache query embeddings",
+        value=True,
+        help="Reuse embeddings for previously seen queries instead of calling Bedrock again",
+    )
 
     st.divider()
     result_field_1 = st.text_input(
@@ -165,40 +263,18 @@ with search_tab:
     if should_search and index and field:
         try:
             with st.spinner("Searching..."):
-                if search_type == "Semantic Search":
-                    search_results = search_and_rerank(
-                        column=field,
-                        embedding_column_suffix=field,
-                        enable_reranking=enable_reranking,
-                        filters=[],
-                        index=index,
-                        opensearch=opensearch,
-                        get_embedding=get_embedding_callback(
-                            bedrock_client=bedrock_client,
-                            bedrock_model_id=st.secrets.get(
-                                "bedrock_model_id", "us.cohere.embed-v4:0"
-                            ),
-                            query=search_query,
-                            vector_dimension=st.secrets.get("vector_dimension", 1536),
-                        ),
-                        profile=st.secrets.get("aws_profile", "default"),
-                        query=search_query,
-                        region=st.secrets.get("aws_region", "us-east-1"),
-                        reporter=reporter,
-                    )
-                else:
-                    search_results: SearchAndRerankResults = {
-                        "search_results": opensearch.search.query(
-                            SearchQueryBuilder(index=index)
-                            .match(field=field, value=search_query)
-                            .build()
-                        ),
-                        "rerank_results": None,
-                        "query": query,
-                        "sources": None,
-                    }
-
-                hits = search_results["search_results"].hits
+                hits = _run_search(
+                    _bedrock_client=bedrock_client,
+                    _opensearch=opensearch,
+                    bedrock_model_id=bedrock_model_id,
+                    enable_reranking=enable_reranking,
+                    fields=tuple(selected_fields),
+                    index=index,
+                    search_query=search_query,
+                    search_type=search_type,
+                    use_embedding_cache=cache_embeddings,
+                    vector_dimension=vector_dimension,
+                )
 
                 if len(hits) > 0:
                     for i, hit in enumerate(hits, 1):
@@ -211,8 +287,14 @@ with search_tab:
                         with st.expander(
                             f"{display_value_1} | {hit['_score']:.3f} | {display_value_2} "
                         ):
-                            for key, value in source.items():
-                                st.write(f"**{key}:** {value}")
+                            # One markdown component per hit instead of one
+                            # st.write per field keeps the DOM small when
+                            # results carry dozens of fields
+                            st.markdown(
+                                "\n\n".join(
+                                    f"**{key}:** {value}" for key, value in source.items()
+                                )
+                            )
                 else:
                     st.warning("No results found for your query.")
 
@@ -242,7 +324,7 @@ with dev_tab:
     # Display OpenSearch endpoint (read-only)
     st.text_input(
         "OpenSearch Endpoint",
-        value=st.secrets["opensearch_endpoint"],
+        value=opensearch_endpoint,
         disabled=True,
         help="OpenSearch cluster endpoint (configured in secrets)",
     )
@@ -259,7 +341,7 @@ with dev_tab:
 
     # Show full URL for reference
     if url_path:
-        full_url = f"{st.secrets['opensearch_endpoint']}{url_path}"
+        full_url = f"{opensearch_endpoint}{url_path}"
         st.caption(f"Full URL: `{full_url}`")
 
     # JSON payload
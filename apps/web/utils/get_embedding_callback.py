@@ -1,6 +1,12 @@
+import sqlite3
+import time
+from collections import OrderedDict
 from collections.abc import Callable, Coroutine
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from lib.bedrock import (
     BedrockClient,
     EmbeddingModelId,
@@ -10,26 +16,117 @@ from lib.bedrock import (
     InvokeModelCommand,
 )
 
+_CACHE_MAX_ENTRIES = 1024
+
+# Module state survives Streamlit reruns, so repeated queries skip the
+# Bedrock round-trip entirely; keyed on model and dimension so switching
+# either never serves a stale vector. Entries are float16 arrays: half
+# precision is ample for cosine ranking and fits twice as many vectors
+# in the same memory as float32, let alone Python float lists
+_embedding_cache: OrderedDict[tuple[str, int, str], np.ndarray] = OrderedDict()
+
+# The on-disk tier survives worker restarts and redeploys, so the hit
+# rate grows with usage instead of resetting; embeddings are
+# deterministic per (model, dimension, query), so rows never go stale
+# and eviction is purely a size cap
+_CACHE_DB_PATH = Path.home() / ".cache" / "semantic-entity-matching" / "embedding_cache.db"
+_CACHE_DB_MAX_ROWS = 10_000
+
+
+def _open_cache_db() -> sqlite3.Connection:
+    """Open (creating if needed) the persistent embedding cache."""
+    _CACHE_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(_CACHE_DB_PATH)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS embeddings ("
+        "model_id TEXT, dimension INTEGER, query TEXT, "
+        "embedding BLOB, created_at REAL, "
+        "PRIMARY KEY (model_id, dimension, query))"
+    )
+    return connection
+
+
+def _cache_db_lookup(cache_key: tuple[str, int, str]) -> np.ndarray | None:
+    """Fetch a cached embedding from disk; cache failures never fail a search."""
+    try:
+        with _open_cache_db() as connection:
+            row = connection.execute(
+                "SELECT embedding FROM embeddings WHERE model_id = ? AND dimension = ? AND query = ?",
+                cache_key,
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+    if row is None:
+        return None
+    return np.frombuffer(row[0], dtype=np.float16)
+
+
+def _cache_db_store(cache_key: tuple[str, int, str], embedding: np.ndarray) -> None:
+    """Persist an embedding to disk, evicting the oldest rows past the cap."""
+    try:
+        with _open_cache_db() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)",
+                (*cache_key, embedding.tobytes(), time.time()),
+            )
+            connection.execute(
+                "DELETE FROM embeddings WHERE rowid IN ("
+                "SELECT rowid FROM embeddings ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (_CACHE_DB_MAX_ROWS,),
+            )
+    except (sqlite3.Error, OSError):
+        pass
+
 
 def get_embedding_callback(
     *,
     bedrock_client: BedrockClient,
     bedrock_model_id: EmbeddingModelId,
     query: str,
+    use_cache: bool = True,
     vector_dimension: int,
 ) -> Callable[[], Coroutine[Any, Any, EmbeddingVector]]:
-    """Returns a callback that gets a query embedding."""
+    """Returns a callback that gets a query embedding.
+
+    Embeddings for a given (model, dimension, query) are deterministic, so
+    cache hits are served from memory with LRU eviction, backed by an
+    on-disk sqlite tier that persists across sessions; pass
+    use_cache=False to force a fresh Bedrock call.
+    """
     invoke_embedding_model_command = InvokeEmbeddingModelCommand(
         InvokeModelCommand(client=bedrock_client)
     )
 
     async def get_embedding() -> EmbeddingVector:
+        cache_key = (str(bedrock_model_id), vector_dimension, query)
+        if use_cache:
+            if cache_key in _embedding_cache:
+                _embedding_cache.move_to_end(cache_key)
+                # Promote back to float32 at the boundary to match what the
+                # adapters return for uncached queries
+                return _embedding_cache[cache_key].astype(np.float32)
+
+            persisted = _cache_db_lookup(cache_key)
+            if persisted is not None:
+                _embedding_cache[cache_key] = persisted
+                if len(_embedding_cache) > _CACHE_MAX_ENTRIES:
+                    _embedding_cache.popitem(last=False)
+                return persisted.astype(np.float32)
+
         results = await invoke_embedding_model_command.execute(
             inputs=[query],
             model_id=EmbeddingModelId(bedrock_model_id),
             embedding_types=[EmbeddingType.FLOAT],
             output_dimension=vector_dimension,
         )
-        return results[0].embeddings[EmbeddingType.FLOAT]
+        embedding = results[0].embeddings[EmbeddingType.FLOAT]
+
+        if use_cache:
+            compact = np.asarray(embedding, dtype=np.float16)
+            _embedding_cache[cache_key] = compact
+            if len(_embedding_cache) > _CACHE_MAX_ENTRIES:
+                _embedding_cache.popitem(last=False)
+            _cache_db_store(cache_key, compact)
+        return embedding
 
     return get_embedding
@@ -1,6 +1,6 @@
 import boto3
 import streamlit as st
-from botocore.credentials import Credentials
+from botocore.credentials import RefreshableCredentials
 
 from lib.interfaces import IReporter
 from lib.opensearch.client import OpenSearchClient
@@ -15,32 +15,40 @@ def get_opensearch_client(
     region: str,
     _reporter: IReporter,
 ) -> OpenSearchClient:
-    """Get an OpenSearch client."""
+    """Get an OpenSearch client.
+
+    st.cache_resource keeps the client alive across reruns, so assumed-role
+    credentials are wrapped in RefreshableCredentials: botocore re-runs the
+    assume-role call shortly before expiry instead of the cached client
+    starting to fail with expired-token errors after ~an hour.
+    """
     # Create a boto3 session with the specified profile (if any)
     session = boto3.Session(profile_name=profile) if profile else boto3.Session()
 
     # If an assume role is provided, assume it and get temporary credentials
     if iam_role:
         print(f"Assuming role: {iam_role}")
-        sts_client = session.client("sts", region_name=region)
 
-        try:
-            # Assume the role
-            response = sts_client.assume_role(
+        def refresh() -> dict[str, str]:
+            """Assume the role and return credentials in botocore's refresh shape."""
+            sts_client = session.client("sts", region_name=region)
+            credentials = sts_client.assume_role(
                 RoleArn=iam_role,
                 RoleSessionName="opensearch-cli-setup",
-            )
+            )["Credentials"]
+            return {
+                "access_key": credentials["AccessKeyId"],
+                "secret_key": credentials["SecretAccessKey"],
+                "token": credentials["SessionToken"],
+                "expiry_time": credentials["Expiration"].isoformat(),
+            }
 
-            # Extract the temporary credentials
-            credentials = response["Credentials"]
-
-            # Create credentials object for OpenSearch client
-            assumed_credentials = Credentials(
-                access_key=credentials["AccessKeyId"],
-                secret_key=credentials["SecretAccessKey"],
-                token=credentials["SessionToken"],
+        try:
+            assumed_credentials = RefreshableCredentials.create_from_metadata(
+                metadata=refresh(),
+                refresh_using=refresh,
+                method="sts-assume-role",
             )
-
             print(f"Successfully assumed role: {iam_role}")
 
         except Exception as e:
@@ -1,4 +1,4 @@
-"""Generic async batch processor with queue-based workers and retry logic.
+"""Generic async batch processor with bounded concurrency and retry logic.
 
 This module provides a reusable pattern for processing large batches of items
 asynchronously with configurable workers, retry strategies, and progress tracking.
@@ -7,9 +7,9 @@ asynchronously with configurable workers, retry strategies, and progress trackin
 import asyncio
 import random
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from botocore.exceptions import ClientError
 
@@ -41,6 +41,11 @@ class ProcessorConfig:
     retry_strategy: RetryStrategy = RetryStrategy.JITTERED
     handle_throttling: bool = True
     on_progress: Callable[[int], None] | None = None
+    # When False, successes are streamed to on_result instead of being
+    # accumulated, so processing millions of items never materializes a
+    # results list; failures are returned in ProcessorResult.failures
+    collect_results: bool = True
+    on_result: Callable[[int, Any], None] | None = None
     # Optional custom exception handling
     retryable_exceptions: tuple[type[Exception], ...] | None = None
     is_throttling: Callable[[Exception], bool] | None = None
@@ -50,15 +55,6 @@ class ProcessorConfig:
             self.retryable_exceptions = (ClientError,)
 
 
-@dataclass
-class WorkItem[TInput]:
-    """Represents a single work item in the queue."""
-
-    index: int
-    data: TInput
-    remaining_attempts: int
-
-
 @dataclass
 class ProcessorResult[TOutput]:
     """Result of batch processing."""
@@ -67,10 +63,13 @@ class ProcessorResult[TOutput]:
     total_processed: int
     total_failed: int
     total_retried: int
+    # Populated instead of results when ProcessorConfig.collect_results is
+    # False; maps input index to the exception that exhausted its retries
+    failures: dict[int, Exception] = field(default_factory=dict)
 
 
 class AsyncBatchProcessor[TInput, TOutput]:
-    """Generic async batch processor using queue-based workers.
+    """Generic async batch processor with semaphore-bounded concurrency.
 
     This processor handles:
     - Concurrent execution with configurable workers
@@ -105,116 +104,165 @@ class AsyncBatchProcessor[TInput, TOutput]:
         self._processor_func = processor_func
         self._config = config or ProcessorConfig()
 
+        # Precompute the capped exponential schedule once instead of doing
+        # the power-and-min arithmetic on every retry, and use a dedicated
+        # RNG so retry storms never contend on the module-level random state
+        self._exponential_backoffs = tuple(
+            min(2.0**attempt, 60.0) for attempt in range(self._config.max_attempts + 1)
+        )
+        self._rng = random.Random()
+
         # Statistics (not thread-safe, only for single event loop)
         self._total_retried = 0
         self._total_failed = 0
+        self._failures: dict[int, Exception] = {}
 
     async def process(self) -> ProcessorResult[TOutput]:
-        """Process all items using queue-based workers.
+        """Process all items with semaphore-bounded concurrency.
+
+        One task per item with retries looping in place keeps dispatch
+        cheap and preserves input order for free via gather; the
+        queue-based worker pattern this replaces paid per-item queue
+        overhead and re-enqueued every retry.
 
         Returns:
             ProcessorResult containing results and statistics
 
         """
-        # Pre-allocate results list to maintain order
-        results: list[TOutput | Exception | None] = [None] * len(self._items)
-
-        # Create queue and pre-fill with work items
-        queue: asyncio.Queue[WorkItem[TInput]] = asyncio.Queue()
-        for index, item in enumerate(self._items):
-            work_item = WorkItem(
-                index=index,
-                data=item,
-                remaining_attempts=self._config.max_attempts,
+        semaphore = asyncio.Semaphore(max(1, self._config.num_workers))
+
+        if self._config.collect_results:
+            results: list[TOutput | Exception] = await asyncio.gather(
+                *(
+                    self._process_one(index=index, item=item, semaphore=semaphore)
+                    for index, item in enumerate(self._items)
+                ),
             )
-            queue.put_nowait(work_item)
-
-        # Start workers
-        workers = [
-            asyncio.create_task(self._worker(queue, results))
-            for _ in range(self._config.num_workers)
-        ]
-
-        await asyncio.gather(*workers)
-
-        # Count failures
-        total_failed = sum(1 for result in results if isinstance(result, Exception))
-
+        else:
+            # TaskGroup discards return values, so nothing the size of the
+            # input ever accumulates; successes flow to on_result as they
+            # complete and only failures are kept
+            results = []
+            async with asyncio.TaskGroup() as task_group:
+                for index, item in enumerate(self._items):
+                    task_group.create_task(
+                        self._stream_one(index=index, item=item, semaphore=semaphore)
+                    )
+
+        # _process_one already counted every failure, so no O(N) sweep of
+        # the results list is needed here
         return ProcessorResult(
-            results=results,  # type: ignore
-            total_processed=len(self._items) - total_failed,
-            total_failed=total_failed,
+            results=results,
+            total_processed=len(self._items) - self._total_failed,
+            total_failed=self._total_failed,
             total_retried=self._total_retried,
+            failures=self._failures,
         )
 
-    async def _worker(
+    async def _stream_one(
         self,
-        queue: asyncio.Queue[WorkItem[TInput]],
-        results: list[TOutput | Exception | None],
+        *,
+        index: int,
+        item: TInput,
+        semaphore: asyncio.Semaphore,
     ) -> None:
-        """Worker that processes items from the queue.
+        """Process one item without retaining its result.
 
         Args:
-            queue: Queue of work items
-            results: Shared results list
+            index: Position of the item in the input list
+            item: The item to process
+            semaphore: Shared semaphore bounding concurrent executions
 
         """
+        outcome = await self._process_one(index=index, item=item, semaphore=semaphore)
+        if isinstance(outcome, Exception):
+            self._failures[index] = outcome
+        elif self._config.on_result is not None:
+            self._config.on_result(index, outcome)
+
+    async def _process_one(
+        self,
+        *,
+        index: int,
+        item: TInput,
+        semaphore: asyncio.Semaphore,
+    ) -> TOutput | Exception:
+        """Process a single item, retrying in place until success or exhaustion.
+
+        Backoff sleeps happen outside the semaphore so a waiting retry
+        never occupies a worker slot that a fresh item could use.
+
+        Args:
+            index: Position of the item in the input list
+            item: The item to process
+            semaphore: Shared semaphore bounding concurrent executions
+
+        """
+        remaining_attempts = self._config.max_attempts
+
         while True:
-            try:
-                work_item = queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-            try:
-                # Process the item
-                result = await self._processor_func(work_item.data)
-                results[work_item.index] = result
-
-                # Report progress via callback
-                if self._config.on_progress:
-                    try:
-                        self._config.on_progress(1)
-                    except Exception as e:
-                        logger.warning(f"Progress callback failed: {e}")
-                        # Don't fail the task just because progress reporting failed
-
-            except Exception as e:
-                # Check if this exception type is configured for retry
-                is_retryable = False
-                if self._config.retryable_exceptions:
-                    is_retryable = isinstance(e, self._config.retryable_exceptions)
-
-                if is_retryable:
-                    await self._handle_retryable_error(e, work_item, queue, results)
+            async with semaphore:
+                try:
+                    result = await self._processor_func(item)
+                except Exception as e:
+                    should_retry, error_code = self._should_retry(
+                        error=e,
+                        index=index,
+                        remaining_attempts=remaining_attempts,
+                    )
+                    if not should_retry:
+                        self._total_failed += 1
+                        return e
                 else:
-                    # Non-retryable exception
-                    logger.error(f"Item {work_item.index}: Non-retryable error: {e}")
-                    results[work_item.index] = e
-                    self._total_failed += 1
+                    # Report progress via callback
+                    if self._config.on_progress:
+                        try:
+                            self._config.on_progress(1)
+                        except Exception as progress_error:
+                            logger.warning(f"Progress callback failed: {progress_error}")
+                            # Don't fail the task just because progress reporting failed
+                    return result
+
+            # Apply backoff before retrying (outside the semaphore)
+            backoff = self._calculate_backoff(remaining_attempts)
+            logger.info(
+                f"Item {index}: {error_code}, retrying in {backoff:.2f}s "
+                f"(attempts left: {remaining_attempts - 1})",
+            )
+            if backoff > 0:
+                await asyncio.sleep(backoff)
 
-            finally:
-                queue.task_done()
+            remaining_attempts -= 1
+            self._total_retried += 1
 
-    async def _handle_retryable_error(
+    def _should_retry(
         self,
+        *,
         error: Exception,
-        work_item: WorkItem[TInput],
-        queue: asyncio.Queue[WorkItem[TInput]],
-        results: list[TOutput | Exception | None],
-    ) -> None:
-        """Handle retryable errors.
+        index: int,
+        remaining_attempts: int,
+    ) -> tuple[bool, str]:
+        """Decide whether a failed attempt should be retried.
 
         Args:
             error: The exception that occurred
-            work_item: The work item that failed
-            queue: The work queue to re-add items to
-            results: Shared results list
+            index: Position of the item in the input list
+            remaining_attempts: Attempts left including the one that just failed
+
+        Returns:
+            Tuple of (should_retry, error_code for logging)
 
         """
+        is_retryable = False
+        if self._config.retryable_exceptions:
+            is_retryable = isinstance(error, self._config.retryable_exceptions)
+
+        if not is_retryable:
+            logger.error(f"Item {index}: Non-retryable error: {error}")
+            return False, str(error)
+
         # Check if throttling using configured checker or default logic
         is_throttling = False
-        error_code = "UnknownError"
-
         if self._config.is_throttling:
             is_throttling = self._config.is_throttling(error)
             error_code = "ThrottlingException" if is_throttling else str(error)
@@ -227,39 +275,19 @@ class AsyncBatchProcessor[TInput, TOutput]:
 
         # If RetryStrategy.NONE is selected, do not retry regardless of error type
         if self._config.retry_strategy == RetryStrategy.NONE:
-            logger.error(f"Item {work_item.index}: Retry disabled by strategy (NONE)")
-            results[work_item.index] = error
-            self._total_failed += 1
-            return
+            logger.error(f"Item {index}: Retry disabled by strategy (NONE)")
+            return False, error_code
 
         # Check if we should retry based on error type and remaining attempts
-        should_retry = False
         if is_throttling:
-            should_retry = self._config.handle_throttling and work_item.remaining_attempts > 1
+            should_retry = self._config.handle_throttling and remaining_attempts > 1
         else:
-            should_retry = work_item.remaining_attempts > 1
-
-        if should_retry:
-            # Apply backoff before retrying
-            backoff = self._calculate_backoff(work_item.remaining_attempts)
-            logger.info(
-                f"Item {work_item.index}: {error_code}, retrying in {backoff:.2f}s "
-                f"(attempts left: {work_item.remaining_attempts - 1})",
-            )
+            should_retry = remaining_attempts > 1
 
-            if backoff > 0:
-                await asyncio.sleep(backoff)
-
-            # Re-queue the item
-            work_item.remaining_attempts -= 1
-            queue.put_nowait(work_item)
-            self._total_retried += 1
-
-        else:
+        if not should_retry:
             # Exhausted retries or throttling disabled
-            logger.error(f"Item {work_item.index}: Failed after all retry attempts")
-            results[work_item.index] = error
-            self._total_failed += 1
+            logger.error(f"Item {index}: Failed after all retry attempts")
+        return should_retry, error_code
 
     def _calculate_backoff(self, remaining_attempts: int) -> float:
         """Calculate backoff delay based on retry strategy.
@@ -279,7 +307,6 @@ class AsyncBatchProcessor[TInput, TOutput]:
 
         if self._config.retry_strategy == RetryStrategy.EXPONENTIAL:
             attempt_number = self._config.max_attempts - remaining_attempts
-            return min(2**attempt_number, 60.0)  # Cap at 60 seconds
-
+            return self._exponential_backoffs[attempt_number]
         # Default: Use jittered backoff strategy
-        return random.uniform(0.5, 2.0)
+        return self._rng.uniform(0.5, 2.0)
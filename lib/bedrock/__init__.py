@@ -1,4 +1,5 @@
 from lib.bedrock.client import BedrockClient
+from lib.bedrock.coalescing_embedder import CoalescingEmbedder
 from lib.bedrock.commands.base_command import BedrockCommand, BedrockCommandInterface
 from lib.bedrock.commands.converse_command import ConverseCommand
 from lib.bedrock.commands.invoke_embedding_model_command import InvokeEmbeddingModelCommand
@@ -17,6 +18,7 @@ __all__ = [
     "BedrockClient",
     "BedrockCommand",
     "BedrockCommandInterface",
+    "CoalescingEmbedder",
     "ConverseCommand",
     "EmbeddingModelId",
     "EmbeddingModelOutput",
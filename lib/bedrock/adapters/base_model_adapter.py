@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any
 
 from lib.bedrock.types import (
@@ -11,6 +12,11 @@ from lib.bedrock.types import (
 class ModelAdapter(ABC):
     """Base adapter for handling different text embedding model formats."""
 
+    # Maximum number of texts the model accepts in a single request;
+    # format_input must split larger input lists into payloads of at most
+    # this size so they can be embedded as parallel requests
+    max_batch_size: int = 1
+
     @abstractmethod
     def get_supported_dimensions(self) -> list[int]:
         """
@@ -44,14 +50,15 @@ class ModelAdapter(ABC):
         input_type: InputType,
         embedding_types: list[EmbeddingType],
         output_dimension: int,
-    ) -> list[dict[str, Any]]:
+    ) -> Iterable[dict[str, Any]]:
         """
         Format the input payload for the embedding model.
 
         Some models support multiple inputs in a single request.
-        Returning a list of dictionaries representing the input for each request
+        Yielding a dictionary representing the input for each request
         allows to run a single request with multiple inputs or multiple requests
-        with a single input.
+        with a single input. Adapters may return a generator so per-input
+        payloads are never all materialized at once.
 
         Args:
             inputs: List of texts to generate embeddings for
@@ -60,7 +67,7 @@ class ModelAdapter(ABC):
             output_dimension: Desired embedding dimension (must be validated first)
 
         Returns:
-            List of dictionaries containing the model-specific payload for each input
+            Iterable of dictionaries containing the model-specific payload for each request
         """
 
     @abstractmethod
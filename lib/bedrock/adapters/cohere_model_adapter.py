@@ -1,5 +1,9 @@
+from functools import lru_cache
+from itertools import batched
 from typing import Any
 
+import numpy as np
+
 from lib.bedrock.adapters.base_model_adapter import ModelAdapter
 from lib.bedrock.types import (
     EmbeddingModelOutput,
@@ -8,6 +12,35 @@ from lib.bedrock.types import (
     ModelOutputParsingError,
 )
 
+# Enum.__call__ does a linear value lookup on every construction; a
+# plain dict lookup avoids that on the per-embedding hot path
+_EMBEDDING_TYPE_BY_VALUE = {
+    embedding_type.value: embedding_type for embedding_type in EmbeddingType
+}
+
+# Numpy dtype for each embedding type the server can return; binary
+# variants arrive as packed bytes, one per 8 dimensions
+_DTYPE_BY_VALUE = {
+    EmbeddingType.FLOAT.value: np.float32,
+    EmbeddingType.INT8.value: np.int8,
+    EmbeddingType.UINT8.value: np.uint8,
+    EmbeddingType.BINARY.value: np.int8,
+    EmbeddingType.UBINARY.value: np.uint8,
+}
+
+
+@lru_cache(maxsize=16)
+def _payload_template(
+    input_type: str, embedding_type_values: tuple[str, ...], output_dimension: int
+) -> dict[str, Any]:
+    """Build the non-texts portion of a payload once per configuration."""
+    return {
+        "input_type": input_type,
+        "embedding_types": list(embedding_type_values),
+        "output_dimension": output_dimension,
+        "truncate": "NONE",
+    }
+
 
 class CohereModelAdapter(ModelAdapter):
     """Adapter for Cohere embedding models.
@@ -16,6 +49,9 @@ class CohereModelAdapter(ModelAdapter):
                      {"embeddings": {"float": [[float, ...], ...]}}
     """
 
+    # Bedrock caps Cohere embed requests at 96 texts
+    max_batch_size = 96
+
     def get_supported_dimensions(self) -> list[int]:
         """Cohere models support dimensions: 256, 512, 1024, 1536."""
         return [256, 512, 1024, 1536]
@@ -28,30 +64,61 @@ class CohereModelAdapter(ModelAdapter):
         embedding_types: list[EmbeddingType],
         output_dimension: int,
     ) -> list[dict[str, Any]]:
-        """Format input for Cohere models."""
+        """Format input for Cohere models, one payload per batch of texts.
+
+        Input lists larger than max_batch_size used to be sent as a single
+        oversized payload, which the model rejects; splitting also lets the
+        caller embed the batches as parallel requests.
+        """
+        template = _payload_template(
+            input_type.value,
+            tuple(embedding_type.value for embedding_type in embedding_types),
+            output_dimension,
+        )
         return [
-            {
-                "input_type": input_type.value,
-                "texts": inputs,
-                "embedding_types": [embedding_type.value for embedding_type in embedding_types],
-                "output_dimension": output_dimension,
-                "truncate": "NONE",
-            }
+            {**template, "texts": list(batch)} for batch in batched(inputs, self.max_batch_size)
         ]
 
     def format_output(self, *, responses: list[dict[str, Any]]) -> list[EmbeddingModelOutput]:
-        """Parse Cohere model response."""
+        """Parse Cohere model responses into one output per input text.
+
+        Each response covers a whole batch (see format_input), with the
+        embeddings for every text of the batch grouped by type, so the
+        responses are flattened back to per-text outputs in input order.
+        """
         try:
-            return [
-                EmbeddingModelOutput(
-                    embeddings={
-                        EmbeddingType(key): values
-                        for key, value in response["embeddings"].items()
-                        for values in value
-                    }
+            outputs: list[EmbeddingModelOutput] = []
+            for response in responses:
+                embeddings = response["embeddings"]
+                if isinstance(embeddings, list):
+                    # Legacy shape without embedding_types: a flat list of
+                    # float vectors, one per text
+                    outputs.extend(
+                        EmbeddingModelOutput(
+                            embeddings={
+                                EmbeddingType.FLOAT: np.asarray(vector, dtype=np.float32)
+                            }
+                        )
+                        for vector in embeddings
+                    )
+                    continue
+
+                vectors_by_type = {
+                    _EMBEDDING_TYPE_BY_VALUE[key]: vectors for key, vectors in embeddings.items()
+                }
+                batch_size = len(next(iter(vectors_by_type.values()), []))
+                outputs.extend(
+                    EmbeddingModelOutput(
+                        embeddings={
+                            embedding_type: np.asarray(
+                                vectors[position], dtype=_DTYPE_BY_VALUE[embedding_type.value]
+                            )
+                            for embedding_type, vectors in vectors_by_type.items()
+                        }
+                    )
+                    for position in range(batch_size)
                 )
-                for response in responses
-            ]
+            return outputs
         except KeyError as e:
             raise ModelOutputParsingError(
                 f"Unexpected response format from Cohere model: {e!s}. "
@@ -1,5 +1,8 @@
+from collections.abc import Iterable
 from typing import Any
 
+import numpy as np
+
 from lib.bedrock.adapters.base_model_adapter import ModelAdapter
 from lib.bedrock.types import (
     EmbeddingModelOutput,
@@ -26,19 +29,23 @@ class TitanModelAdapter(ModelAdapter):
         input_type: InputType = InputType.SEARCH_DOCUMENT,  # noqa: ARG002
         embedding_types: list[EmbeddingType] | None = None,  # noqa: ARG002
         output_dimension: int = 1024,  # noqa: ARG002
-    ) -> list[dict[str, Any]]:
-        """Format input for Titan models.
+    ) -> Iterable[dict[str, Any]]:
+        """Format input for Titan models, one payload per text, lazily.
 
         Note: Titan models don't use input_type, embedding_types, or output_dimension,
         but these parameters are part of the ModelAdapter interface.
         """
-        return [{"inputText": text_input} for text_input in inputs]
+        return ({"inputText": text_input} for text_input in inputs)
 
     def format_output(self, *, responses: list[dict[str, Any]]) -> list[EmbeddingModelOutput]:
         """Parse Titan model response: {"embedding": [float, ...]}."""
         try:
             return [
-                EmbeddingModelOutput(embeddings={EmbeddingType.FLOAT: response["embedding"]})
+                EmbeddingModelOutput(
+                    embeddings={
+                        EmbeddingType.FLOAT: np.asarray(response["embedding"], dtype=np.float32)
+                    }
+                )
                 for response in responses
             ]
         except KeyError as e:
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from contextlib import suppress
 from typing import Any, cast
 
 import aioboto3  # type: ignore
@@ -11,8 +13,10 @@ from lib.dynamic_semaphore import DynamicSemaphore
 class BedrockClient:
     __client: BedrockRuntimeClient | None
     __client_context: Any
+    __client_loop: asyncio.AbstractEventLoop | None
     __config: Config
     __initial_concurrency: int
+    __max_concurrency: int
     __region: str
     __semaphore: DynamicSemaphore | None
     __session: Any
@@ -22,19 +26,30 @@ class BedrockClient:
         *,
         initial_concurrency: int = 5,
         max_attempts: int = 5,
+        max_concurrency: int = 50,
         profile: str | None = None,
         region: str | None = None,
         timeout: float = 30,
     ):
         self.__client = None
         self.__client_context = None
+        self.__client_loop = None
+        self.__max_concurrency = max(max_concurrency, initial_concurrency)
         self.__config = Config(
-            max_pool_connections=initial_concurrency * 10,
+            # TCP keep-alive keeps warm connections from being silently
+            # dropped by intermediaries, and a short connect timeout fails
+            # over quickly instead of burning the whole read timeout on an
+            # unreachable endpoint
+            connect_timeout=min(5, timeout),
+            # Sized past the semaphore's ceiling so the pool can never
+            # starve at full concurrency and force a TLS handshake per call
+            max_pool_connections=self.__max_concurrency * 2,
             read_timeout=timeout,
             retries={
                 "max_attempts": max_attempts - 1,
                 "mode": "standard",
             },
+            tcp_keepalive=True,
         )
         self.__initial_concurrency = initial_concurrency
         self.__region = region or os.getenv("AWS_REGION", "us-east-1")
@@ -48,9 +63,23 @@ class BedrockClient:
         This method ensures the client is created once and reused across all requests,
         which enables connection pooling and eliminates connection setup/teardown overhead.
 
+        The underlying aiohttp session is bound to the event loop that created
+        it, so a client cached under a previous loop (e.g. an earlier
+        asyncio.run() call) is discarded and rebuilt instead of failing with
+        "Event loop is closed" on its first request.
+
         Returns:
             BedrockRuntimeClient instance
         """
+        loop = asyncio.get_running_loop()
+        if self.__client is not None and self.__client_loop is not loop:
+            # Best-effort cleanup: the owning loop is usually closed already,
+            # in which case its connections died with it
+            with suppress(Exception):
+                await self.__client_context.__aexit__(None, None, None)
+            self.__client = None
+            self.__client_context = None
+
         if self.__client is None:
             # Create the client context manager
             self.__client_context = self.__session.client(
@@ -60,6 +89,7 @@ class BedrockClient:
             )
             # Enter the context manager and cache the client
             self.__client = await self.__client_context.__aenter__()
+            self.__client_loop = loop
 
         return cast("BedrockRuntimeClient", self.__client)
 
@@ -74,8 +104,8 @@ class BedrockClient:
         The dynamic semaphore automatically adjusts concurrency based on throttling:
         - Starts at configured concurrency
         - Decreases by 25% on throttle
-        - Increases by 1 after sustained success (10x concurrency successful requests)
-        - Min: 1, no maximum (can grow unbounded)
+        - Increases by 1 after one success per in-flight slot (scales with capacity)
+        - Min: 1, max: max_concurrency (so growth stays within the connection pool)
 
         Returns:
             DynamicSemaphore bound to the current event loop
@@ -84,13 +114,24 @@ class BedrockClient:
             self.__semaphore = DynamicSemaphore(
                 decrease_factor=0.75,
                 initial=self.__initial_concurrency,
-                increase_threshold=100,
                 log_level="info",
+                max_value=self.__max_concurrency,
                 min_value=1,
             )
 
         return self.__semaphore
 
+    async def warmup(self) -> None:
+        """Create the runtime client ahead of the first real request.
+
+        Client construction resolves credentials and the endpoint and
+        builds the connection pool (~hundreds of ms); doing it up front
+        keeps that cost out of the first embedding or converse call.
+        The bedrock-runtime service has no free no-op API, so the TLS
+        handshake itself still happens on the first request.
+        """
+        await self.get_client()
+
     async def close(self) -> None:
         """
         Close the Bedrock client and clean up connections.
@@ -99,9 +140,38 @@ class BedrockClient:
         proper cleanup of HTTP connections and resources.
         """
         if self.__client is not None and self.__client_context is not None:
-            await self.__client_context.__aexit__(None, None, None)
+            if self.__client_loop is asyncio.get_running_loop():
+                await self.__client_context.__aexit__(None, None, None)
+            else:
+                # The owning loop is gone (close_sync always runs on a fresh
+                # one), so a clean shutdown is impossible — drop the references
+                with suppress(Exception):
+                    await self.__client_context.__aexit__(None, None, None)
             self.__client = None
             self.__client_context = None
+            self.__client_loop = None
+
+    def close_sync(self) -> None:
+        """Close the client from synchronous code.
+
+        Owns the event-loop handling so callers no longer need their own
+        cleanup dance: close() runs via asyncio.run() when no loop is
+        active, and on a fresh loop otherwise (e.g. teardown triggered
+        from within a nested event-loop context).
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop, safe to use asyncio.run()
+            asyncio.run(self.close())
+            return
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.close())
+        finally:
+            loop.close()
 
     async def __aenter__(self) -> "BedrockClient":
         """Enter the async context manager."""
@@ -110,3 +180,11 @@ class BedrockClient:
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Exit the async context manager and clean up resources."""
         await self.close()
+
+    def __enter__(self) -> "BedrockClient":
+        """Enter the sync context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit the sync context manager and clean up resources."""
+        self.close_sync()
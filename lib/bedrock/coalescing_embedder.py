@@ -0,0 +1,120 @@
+import asyncio
+from collections import deque
+
+from lib.bedrock.commands.invoke_embedding_model_command import InvokeEmbeddingModelCommand
+from lib.bedrock.types import (
+    EmbeddingModelId,
+    EmbeddingModelOutput,
+    EmbeddingType,
+    InputType,
+)
+
+
+class CoalescingEmbedder:
+    """Coalesce concurrent single-text embedding calls into batched requests.
+
+    Callers that embed one text at a time from many concurrent tasks pay
+    one Bedrock round-trip each. This wrapper parks each call on a queue,
+    waits a short window for fellow travellers, and issues one multi-input
+    request per drained batch, resolving the callers' futures in order.
+    N round-trips become ceil(N / max_batch_size).
+
+    Instances hold asyncio primitives bound to the running loop, so create
+    one per event loop and share it between tasks on that loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        command: InvokeEmbeddingModelCommand,
+        embedding_types: list[EmbeddingType] | None = None,
+        input_type: InputType = InputType.SEARCH_DOCUMENT,
+        max_batch_size: int = 96,
+        max_concurrent_batches: int = 4,
+        model_id: EmbeddingModelId,
+        output_dimension: int = 1024,
+        window_seconds: float = 0.005,
+    ) -> None:
+        """Initialize the coalescing embedder.
+
+        Args:
+            command: InvokeEmbeddingModelCommand to issue batched requests with
+            embedding_types: List of types of embedding to generate
+            input_type: Type of input to generate embeddings for
+            max_batch_size: Maximum inputs packed into one Bedrock request
+            max_concurrent_batches: Maximum batches in flight at once
+            model_id: Bedrock text embedding model ID
+            output_dimension: Desired embedding dimension
+            window_seconds: How long a batch waits to collect more calls
+        """
+        self._command = command
+        self._embedding_types = embedding_types
+        self._input_type = input_type
+        self._max_batch_size = max_batch_size
+        self._model_id = model_id
+        self._output_dimension = output_dimension
+        self._window_seconds = window_seconds
+
+        # A plain deque suffices here: only the event-loop thread touches
+        # it and nothing blocks on it, so asyncio.Queue's condition
+        # variables and counters would be pure overhead
+        self._pending: deque[tuple[str, asyncio.Future[EmbeddingModelOutput]]] = deque()
+        self._batch_semaphore = asyncio.Semaphore(max_concurrent_batches)
+        self._flusher: asyncio.Task[None] | None = None
+        # Keep strong references so in-flight batch tasks are not collected
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def embed(self, text: str) -> EmbeddingModelOutput:
+        """Embed one text, transparently sharing a request with concurrent calls.
+
+        Args:
+            text: Text to generate an embedding for
+
+        Returns:
+            EmbeddingModelOutput for the text
+        """
+        future: asyncio.Future[EmbeddingModelOutput] = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+        return await future
+
+    async def _flush_loop(self) -> None:
+        """Drain pending calls into batches until none are waiting."""
+        while self._pending:
+            # Let concurrent embed() calls pile up before cutting a batch
+            await asyncio.sleep(self._window_seconds)
+
+            batch: list[tuple[str, asyncio.Future[EmbeddingModelOutput]]] = []
+            while len(batch) < self._max_batch_size and self._pending:
+                batch.append(self._pending.popleft())
+
+            if batch:
+                task = asyncio.create_task(self._run_batch(batch))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    async def _run_batch(
+        self,
+        batch: list[tuple[str, asyncio.Future[EmbeddingModelOutput]]],
+    ) -> None:
+        """Issue one multi-input request and resolve the batch's futures in order."""
+        async with self._batch_semaphore:
+            try:
+                outputs = await self._command.execute(
+                    embedding_types=self._embedding_types,
+                    inputs=[text for text, _ in batch],
+                    input_type=self._input_type,
+                    model_id=self._model_id,
+                    output_dimension=self._output_dimension,
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+        for (_, future), output in zip(batch, outputs, strict=True):
+            if not future.done():
+                future.set_result(output)
@@ -1,5 +1,8 @@
 import asyncio
-from typing import Any, ClassVar
+import hashlib
+from collections import OrderedDict
+from functools import cache
+from typing import Any
 
 from lib.bedrock.adapters.base_model_adapter import ModelAdapter
 from lib.bedrock.adapters.cohere_model_adapter import CohereModelAdapter
@@ -13,33 +16,56 @@ from lib.bedrock.types import (
     InputType,
 )
 
+_CACHE_MAX_ENTRIES = 4096
 
-class InvokeEmbeddingModelCommand(BedrockCommandInterface):
-    __adapters: ClassVar[dict[EmbeddingModelId, ModelAdapter]] = {
-        EmbeddingModelId.TITAN: TitanModelAdapter(),
-        EmbeddingModelId.COHERE: CohereModelAdapter(),
-    }
+# Precomputed once instead of rebuilt per get_model_id call
+_MODEL_ID_BY_VALUE = {model_id.value: model_id for model_id in EmbeddingModelId}
+
+
+@cache
+def _get_adapter(model_id: EmbeddingModelId) -> ModelAdapter:
+    """Build the adapter for a model on first use and reuse it after."""
+    match model_id:
+        case EmbeddingModelId.TITAN:
+            return TitanModelAdapter()
+        case EmbeddingModelId.COHERE:
+            return CohereModelAdapter()
+        case _:
+            raise ValueError(f"Unsupported text embedding model ID: {model_id}")
+
+# Entity-matching inputs are full of duplicate rows; an exact-match cache
+# keyed on the text digest plus every request parameter that shapes the
+# output turns repeat embeddings into dict lookups with zero Bedrock
+# calls. Embeddings are deterministic per key, so entries never go stale
+# and eviction is plain LRU
+_embedding_cache: OrderedDict[tuple[Any, ...], EmbeddingModelOutput] = OrderedDict()
+
+
+def _cache_key(
+    *,
+    embedding_types: list[EmbeddingType],
+    input_type: InputType,
+    model_id: EmbeddingModelId,
+    output_dimension: int,
+    text: str,
+) -> tuple[Any, ...]:
+    """Build the cache key for one input text; hashed so keys stay small."""
+    return (
+        model_id.value,
+        input_type.value,
+        output_dimension,
+        tuple(embedding_type.value for embedding_type in embedding_types),
+        hashlib.blake2b(text.encode("utf-8")).digest(),
+    )
 
+
+class InvokeEmbeddingModelCommand(BedrockCommandInterface):
     def __init__(
         self,
         invoke_model_command: InvokeModelCommand,
     ):
         self.__invoke_model_command = invoke_model_command
 
-    def __get_model_adapter(self, model_id: EmbeddingModelId) -> ModelAdapter:
-        """
-        Get the appropriate text embedding model adapter for the given model ID.
-
-        Args:
-            model_id: Bedrock embedding model ID
-
-        Returns:
-            ModelAdapter instance for the model
-        """
-        if model_id not in self.__adapters:
-            raise ValueError(f"Unsupported text embedding model ID: {model_id}")
-        return self.__adapters[model_id]
-
     async def execute(
         self,
         *,
@@ -65,26 +91,57 @@ class InvokeEmbeddingModelCommand(BedrockCommandInterface):
             embedding_types = [EmbeddingType.FLOAT]
 
         # Get the appropriate text embedding model adapter for this model
-        adapter = self.__get_model_adapter(model_id)
+        adapter = _get_adapter(model_id)
 
         # Validate dimension before formatting input
         adapter.validate_dimension(output_dimension)
 
-        # Format input using the text embedding model adapter
-        payloads = adapter.format_input(
-            inputs=inputs,
-            input_type=input_type,
-            embedding_types=embedding_types,
-            output_dimension=output_dimension,
-        )
-
-        responses = await asyncio.gather(
-            *[
-                self.__invoke_model_command.execute(model_id=model_id, body=payload)
-                for payload in payloads
-            ]
-        )
-        return adapter.format_output(responses=responses)
+        # Partition inputs into cache hits and misses; only misses go to
+        # Bedrock, and results are stitched back in original order
+        cache_keys = [
+            _cache_key(
+                embedding_types=embedding_types,
+                input_type=input_type,
+                model_id=model_id,
+                output_dimension=output_dimension,
+                text=text,
+            )
+            for text in inputs
+        ]
+        outputs: list[EmbeddingModelOutput | None] = [None] * len(inputs)
+        miss_indexes: list[int] = []
+        for index, key in enumerate(cache_keys):
+            cached = _embedding_cache.get(key)
+            if cached is not None:
+                _embedding_cache.move_to_end(key)
+                outputs[index] = cached
+            else:
+                miss_indexes.append(index)
+
+        if miss_indexes:
+            # format_input may yield payloads lazily; stream them straight
+            # into the coroutine list instead of materializing them first
+            responses = await asyncio.gather(
+                *[
+                    self.__invoke_model_command.execute(model_id=model_id, body=payload)
+                    for payload in adapter.format_input(
+                        inputs=[inputs[index] for index in miss_indexes],
+                        input_type=input_type,
+                        embedding_types=embedding_types,
+                        output_dimension=output_dimension,
+                    )
+                ]
+            )
+            # format_output yields one output per input text, in order
+            for index, output in zip(
+                miss_indexes, adapter.format_output(responses=responses), strict=True
+            ):
+                outputs[index] = output
+                _embedding_cache[cache_keys[index]] = output
+                if len(_embedding_cache) > _CACHE_MAX_ENTRIES:
+                    _embedding_cache.popitem(last=False)
+
+        return outputs
 
 
     def get_tokens_count(self) -> tuple[int, int]:
@@ -102,6 +159,6 @@ class InvokeEmbeddingModelCommand(BedrockCommandInterface):
             EmbeddingModelId enum value
         """
         try:
-            return {model_id.value: model_id for model_id in EmbeddingModelId}[model_id]
+            return _MODEL_ID_BY_VALUE[model_id]
         except KeyError as e:
             raise ValueError(f"Unsupported embedding model ID: {model_id}") from e
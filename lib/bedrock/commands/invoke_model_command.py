@@ -1,6 +1,7 @@
-import json
+import time
 from typing import Any
 
+import orjson
 from botocore.exceptions import ClientError
 
 from lib.bedrock.commands.base_command import BedrockCommand
@@ -10,6 +11,32 @@ from lib.logging import get_logger
 logger = get_logger(__name__)
 
 
+async def _read_response_body(response: dict[str, Any]) -> bytes | bytearray:
+    """Read the streaming body, preallocating when the size is known.
+
+    A bare read() accumulates chunks and joins them into a fresh bytes
+    object, briefly doubling peak memory on large batched-embedding
+    responses; with Content-Length available the chunks are copied
+    straight into one right-sized bytearray instead.
+    """
+    headers = response["ResponseMetadata"]["HTTPHeaders"]
+    content_length = headers.get("content-length")
+    body = response["body"]
+    if content_length is None:
+        return await body.read()
+
+    buffer = bytearray(int(content_length))
+    view = memoryview(buffer)
+    offset = 0
+    while offset < len(buffer):
+        chunk = await body.read(len(buffer) - offset)
+        if not chunk:
+            break
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return buffer if offset == len(buffer) else buffer[:offset]
+
+
 class InvokeModelCommand(BedrockCommand):
     async def execute(
         self,
@@ -20,21 +47,32 @@ class InvokeModelCommand(BedrockCommand):
     ) -> dict[str, Any]:
         semaphore = self._client.get_semaphore()
         try:
+            # The semaphore bounds request submission only; the model has
+            # answered once invoke_model returns, so holding a slot while
+            # the body downloads would let slow reads starve submission
             async with semaphore:
                 client = await self._client.get_client()
+                # orjson encodes/decodes in native code and returns bytes
+                # directly (bedrock-runtime accepts them), keeping this CPU
+                # work off the event loop's critical path under high fan-out
+                started = time.monotonic()
                 response = await client.invoke_model(
-                    body=json.dumps(body),
+                    body=orjson.dumps(body),
                     modelId=model_id.value,
                     accept="application/json",
                     contentType="application/json",
                     **kwargs,
                 )
-                result = json.loads(await response["body"].read())
+                # Sampled RTTs let the semaphore brake concurrency growth
+                # before the model starts answering with throttles
+                semaphore.record_latency(time.monotonic() - started)
+
+            result = orjson.loads(await _read_response_body(response))
 
-                # Report success to dynamic semaphore
-                await semaphore.on_success()
+            # Report success to dynamic semaphore
+            await semaphore.on_success()
 
-                return result
+            return result
         except ClientError as e:
             # Check if this is a throttling exception
             error_code = e.response.get("Error", {}).get("Code")
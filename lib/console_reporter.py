@@ -1,11 +1,17 @@
 """Console reporter for CLI commands."""
 
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import NoReturn
 
 from tqdm import tqdm
 
 from lib.interfaces import IReporter
 
+# Flush the buffered writer once it holds this many characters
+_BUFFER_FLUSH_THRESHOLD = 4096
+
 
 class ConsoleReporter(IReporter):
     """Console reporter that prints messages to stdout and updates a progress bar."""
@@ -13,26 +19,80 @@ class ConsoleReporter(IReporter):
     def __init__(self) -> None:
         """Initialize the reporter."""
         self._progress_bar: tqdm[NoReturn] | None = None
+        self._buffer: list[str] | None = None
+        self._buffer_size = 0
+        self._pending_progress = 0
+        self._progress_step = 1
 
     def on_message(self, *messages: str) -> None:
         """Print message to console."""
+        if self._buffer is not None:
+            for message in messages:
+                self._buffer.append(message)
+                self._buffer_size += len(message) + 1
+            if self._buffer_size >= _BUFFER_FLUSH_THRESHOLD:
+                self._flush_buffer()
+            return
         for message in messages:
             print(message)
 
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Coalesce on_message output into few large writes.
+
+        Hot loops that report per row otherwise pay one stdout write (and
+        flush) per message; inside this context messages accumulate and
+        are flushed every few kilobytes and once on exit.
+        """
+        self._buffer = []
+        self._buffer_size = 0
+        try:
+            yield
+        finally:
+            self._flush_buffer()
+            self._buffer = None
+
+    def _flush_buffer(self) -> None:
+        """Write out any buffered messages in a single write."""
+        if self._buffer:
+            sys.stdout.write("\n".join(self._buffer) + "\n")
+            self._buffer = []
+            self._buffer_size = 0
+
     def on_input(self, message: str) -> str:
         """Read input from console."""
         return input(message)
 
     def start_progress(self, total: int) -> None:
         """Start progress bar."""
-        self._progress_bar = tqdm(total=total)
+        # Repaint at most every 0.2s / 0.1% of the total; per-item
+        # refreshes dominate the reporter's CPU time at high throughput
+        self._progress_step = max(total // 1000, 1)
+        self._pending_progress = 0
+        self._progress_bar = tqdm(
+            total=total,
+            mininterval=0.2,
+            miniters=self._progress_step,
+            smoothing=0.1,
+        )
 
     def stop_progress(self) -> None:
         """Stop progress bar."""
         if self._progress_bar:
+            if self._pending_progress:
+                self._progress_bar.update(self._pending_progress)
+                self._pending_progress = 0
             self._progress_bar.close()
 
     def on_progress(self, value: int) -> None:
-        """Update progress bar."""
+        """Update progress bar.
+
+        Increments are accumulated locally and handed to tqdm in chunks
+        of the refresh step, so a million per-item calls turn into ~1000
+        calls into tqdm's lock-protected update path.
+        """
         if self._progress_bar:
-            self._progress_bar.update(value)
+            self._pending_progress += value
+            if self._pending_progress >= self._progress_step:
+                self._progress_bar.update(self._pending_progress)
+                self._pending_progress = 0
@@ -1,14 +1,17 @@
-import asyncio
+class AsyncCounter:
+    """Counter for coroutines sharing a single event loop.
 
+    No lock needed: += has no await between read and write, so the
+    event loop never interleaves another task inside it. The previous
+    asyncio.Lock added two awaits per token-count update for no
+    correctness benefit.
+    """
 
-class AsyncCounter:
     def __init__(self, *, initial_value=0) -> None:
         self._count = initial_value
-        self._lock = asyncio.Lock()
 
-    async def add(self, value: int) -> None:
-        async with self._lock:
-            self._count += value
+    def add(self, value: int) -> None:
+        self._count += value
 
     def value(self) -> int:
         return self._count
@@ -2,10 +2,14 @@
 
 Uses AIMD (Additive Increase / Multiplicative Decrease) algorithm:
 - On throttle: Reduce capacity by decrease_factor% (multiplicative decrease)
-- On success: Increase capacity by 1 after increase_threshold% number of successes (additive increase)
+- On success: Increase capacity by 1 after a threshold of successes (additive increase)
 """
 
 import asyncio
+import os
+import random
+import time
+from collections import deque
 from typing import Any, Literal
 
 from lib.logging import get_logger
@@ -16,65 +20,122 @@ logger = get_logger(__name__)
 class DynamicSemaphore:
     """A semaphore with adjustable capacity that responds to throttling.
 
-    This implementation uses condition variables to allow precise control
-    over capacity changes without recreating semaphores.
+    This implementation uses a plain slot counter plus a FIFO deque of
+    waiter futures (the same shape as asyncio.Semaphore) so the
+    uncontended acquire/release path is a counter bump with no lock;
+    capacity changes just wake waiters directly. Everything runs on the
+    event loop thread, so no further synchronization is needed.
 
     Auto-tuning parameters are calculated based on initial concurrency:
     - min_value: 1 (never go below 1)
-    - increase_threshold: 10x initial concurrency (require sustained success)
+    - increase_threshold: scales with current capacity (one success per
+      in-flight slot per bump), so ramp-up time grows linearly with the
+      target concurrency instead of quadratically. A small random jitter
+      is added per bump so semaphores in separate processes hitting the
+      same backend do not re-synchronize their recovery after a shared
+      throttle event
     - decrease_factor: 0.5 (cut in half on throttle)
-    - No maximum capacity - can grow unbounded
+    - No maximum capacity by default - can grow unbounded unless max_value is set
     """
 
     def __init__(
         self,
         *,
+        decrease_cooldown: float = 1.0,
         decrease_factor: float = 0.5,
         increase_threshold: int | None = None,
         initial: int = 4,
         log_level: Literal["debug", "info", "none"] = "info",
+        max_value: int | None = None,
         min_value: int = 1,
     ) -> None:
         """Initialize the dynamic semaphore.
 
         Args:
+            decrease_cooldown: Minimum seconds between capacity decreases
+                              (default: 1.0). One throttle event fails every
+                              in-flight request at once; the cooldown makes
+                              that burst count as a single decrease.
             decrease_factor: Factor to multiply capacity by on throttle (default: 0.5)
-            increase_threshold: Number of successes before increasing capacity.
-                              If None, defaults to 10x initial concurrency.
+            increase_threshold: Fixed number of successes before increasing
+                              capacity. If None, the threshold tracks the
+                              current capacity (one success per in-flight
+                              slot, the AIMD "+1 per RTT" rule).
             initial: Initial capacity (default: 4)
             log_level: Logging level for capacity changes ("debug", "info", "none")
+            max_value: Maximum capacity; None means unbounded growth (default: None)
             min_value: Minimum capacity (default: 1)
 
         """
         if not 0 < decrease_factor < 1:
             raise ValueError("decrease_factor must be between 0 and 1")
+        if decrease_cooldown < 0:
+            raise ValueError("decrease_cooldown must be >= 0")
         if initial < min_value:
             raise ValueError(f"initial ({initial}) must be >= min_value ({min_value})")
+        if max_value is not None and max_value < initial:
+            raise ValueError(f"max_value ({max_value}) must be >= initial ({initial})")
 
         self._capacity = initial
+        self._max_value = max_value
         self._min_value = min_value
-        self._increase_threshold = (
-            increase_threshold if increase_threshold is not None else initial * 10
-        )
+        self._increase_threshold = increase_threshold
+        self._decrease_cooldown = decrease_cooldown
         self._decrease_factor = decrease_factor
+        self._last_decrease = -1.0e18  # Monotonic time of the last decrease
         self._success_count = 0
         self._current_count = 0  # Currently acquired slots
-        self._condition = asyncio.Condition()
+        self._waiters: deque[asyncio.Future[None]] = deque()
         self._log_level = log_level
+        # Independent seed per instance so co-located processes desync
+        self._random = random.Random(os.urandom(8))
+        self._threshold_jitter = 0
+        # Latency congestion signal (see record_latency)
+        self._latency_samples: deque[float] = deque(maxlen=100)
+        self._min_rtt = float("inf")
+        self._last_latency_check = -1.0e18
+        self._latency_degraded = False
+
+    def _wake_next(self) -> None:
+        """Hand a free slot to the first waiter that is still pending."""
+        if self._current_count >= self._capacity:
+            return
+        for fut in self._waiters:
+            if not fut.done():
+                # Transfer the slot here so another task cannot slip past
+                # the queued waiter between wake-up and resumption
+                self._current_count += 1
+                fut.set_result(None)
+                return
 
     async def acquire(self) -> None:
         """Acquire a slot, waiting if capacity is full."""
-        async with self._condition:
-            # Wait until we can acquire
-            await self._condition.wait_for(lambda: self._current_count < self._capacity)
+        if not self._waiters and self._current_count < self._capacity:
             self._current_count += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            try:
+                await fut
+            finally:
+                self._waiters.remove(fut)
+        except asyncio.CancelledError:
+            if not fut.cancelled():
+                # A slot was granted concurrently with the cancellation;
+                # pass it on instead of leaking it
+                self._current_count -= 1
+                self._wake_next()
+            raise
+        # A capacity increase may have freed more than one slot; keep the
+        # wake-up chain going for the waiters behind us
+        self._wake_next()
 
     async def release(self) -> None:
-        """Release a slot and notify waiting tasks."""
-        async with self._condition:
-            self._current_count -= 1
-            # Notify one waiting task that a slot is available
-            self._condition.notify()
+        """Release a slot and wake the next waiting task, if any."""
+        self._current_count -= 1
+        self._wake_next()
 
     async def __aenter__(self):
         await self.acquire()
@@ -88,34 +149,101 @@ class DynamicSemaphore:
 
         This method should be called when a ThrottlingException is encountered.
         """
-        async with self._condition:
-            old_capacity = self._capacity
-            new_capacity = max(self._min_value, int(self._capacity * self._decrease_factor))
+        # Already at the floor; skip the recompute and log plumbing
+        if self._capacity <= self._min_value:
+            return
 
-            if new_capacity < old_capacity:
-                self._capacity = new_capacity
-                self._success_count = 0
-                self._log_change("throttle", old_capacity, new_capacity)
+        # One throttle event fails every in-flight request at once; only
+        # the first callback of the burst should decrease capacity, or a
+        # volley of 429s compounds the halving straight down to the floor
+        now = time.monotonic()
+        if now - self._last_decrease < self._decrease_cooldown:
+            return
+
+        old_capacity = self._capacity
+        new_capacity = max(self._min_value, int(self._capacity * self._decrease_factor))
+
+        if new_capacity < old_capacity:
+            self._capacity = new_capacity
+            self._success_count = 0
+            self._last_decrease = now
+            self._reroll_threshold_jitter()
+            self._log_change("throttle", old_capacity, new_capacity)
 
     async def on_success(self) -> None:
         """Increase capacity gradually after sustained success (additive increase).
 
         This method should be called after each successful request.
-        Capacity can grow unbounded.
+        Capacity grows unbounded unless max_value was set.
         """
-        async with self._condition:
-            self._success_count += 1
+        # Fast path: every successful request lands here, and almost all
+        # of them are below the threshold. A fixed threshold would make
+        # ramp time quadratic in the target capacity, so the adaptive
+        # default asks for one success per in-flight slot per bump
+        self._success_count += 1
+        threshold = (
+            self._increase_threshold
+            if self._increase_threshold is not None
+            else self._capacity + self._threshold_jitter
+        )
+        if self._success_count < threshold:
+            return
 
-            if self._success_count >= self._increase_threshold:
-                old_capacity = self._capacity
-                new_capacity = self._capacity + 1
+        # Rising latency means server-side queueing has already started;
+        # stop growing before the backend has to answer with a throttle
+        if self._latency_degraded:
+            self._success_count = 0
+            return
 
-                self._capacity = new_capacity
-                # Notify waiting tasks that capacity increased
-                self._condition.notify()
-                self._log_change("success", old_capacity, new_capacity)
+        if self._max_value is not None and self._capacity >= self._max_value:
+            return
 
-                self._success_count = 0
+        old_capacity = self._capacity
+        new_capacity = self._capacity + 1
+
+        self._capacity = new_capacity
+        # Hand the new slot to a waiting task, if any
+        self._wake_next()
+        self._log_change("success", old_capacity, new_capacity)
+
+        self._success_count = 0
+        self._reroll_threshold_jitter()
+
+    def record_latency(self, rtt_seconds: float) -> None:
+        """Feed one request round-trip time into the congestion signal.
+
+        AIMD alone only reacts to hard throttle errors, so capacity keeps
+        climbing until the backend 429s. Sampled RTTs give an earlier
+        signal: when the recent p95 rises more than 25% above the best
+        observed RTT (the Envoy gradient controller's headroom), requests
+        are queueing server-side and on_success stops increasing capacity
+        until latency recovers. The signal is recomputed at most once per
+        second over a rolling window of the last 100 samples.
+        """
+        if rtt_seconds < self._min_rtt:
+            self._min_rtt = rtt_seconds
+        self._latency_samples.append(rtt_seconds)
+
+        now = time.monotonic()
+        if now - self._last_latency_check < 1.0 or len(self._latency_samples) < 10:
+            return
+        self._last_latency_check = now
+
+        samples = sorted(self._latency_samples)
+        p95 = samples[int(len(samples) * 0.95)]
+        self._latency_degraded = p95 > self._min_rtt * 1.25
+
+    def _reroll_threshold_jitter(self) -> None:
+        """Draw a fresh jitter for the adaptive increase threshold.
+
+        Concurrent workers sharing a backend all see the same throttle
+        event and would otherwise bump capacity in lock-step, recreating
+        the load spike that caused the throttle; jittering each cycle's
+        threshold by up to 25% staggers the recovery. Fixed explicit
+        thresholds stay deterministic.
+        """
+        if self._increase_threshold is None:
+            self._threshold_jitter = self._random.randint(0, self._capacity // 4)
 
     def _log_change(self, reason: str, old_capacity: int, new_capacity: int) -> None:
         """Log capacity changes based on configured log level."""
@@ -5,9 +5,11 @@ by running vector searches against test datasets. It is framework-agnostic
 and reusable by CLI, Lambda, and web applications.
 """
 
-import json
+from collections.abc import Iterator
 from typing import Any
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from lib.interfaces import IReporter
@@ -16,12 +18,30 @@ from lib.opensearch.client import OpenSearchClient
 
 logger = get_logger(__name__)
 
+# Strip msearch responses down to what the result loop actually reads;
+# per hit that drops _index, _id, shard info and the total-hits object.
+# responses.status keeps zero-hit responses from being filtered down to
+# nothing and dropped from the array, which would misalign it with
+# pending_queries
+_MSEARCH_FILTER_PATH = ",".join(
+    (
+        "responses.status",
+        "responses.error",
+        "responses.hits.hits._score",
+        "responses.hits.hits._source",
+    )
+)
+
 
-def get_top_k_metric(matched_queries: list[dict], k: int, total_queries: int) -> float:
-    """Calculate the percentage of matched queries that have rank <= k.
+def get_top_k_metric(ranks: np.ndarray, k: int, total_queries: int) -> float:
+    """Calculate the percentage of queries that have rank <= k.
+
+    A single vectorized comparison per k replaces a Python-level scan of
+    the result dicts; extract ranks into an array once and reuse it for
+    every k.
 
     Args:
-        matched_queries: List of matched query results with 'rank' field
+        ranks: Array of ranks of the matched queries
         k: Top-k threshold
         total_queries: Total number of queries
 
@@ -29,12 +49,12 @@ def get_top_k_metric(matched_queries: list[dict], k: int, total_queries: int) ->
         Percentage of queries with rank <= k
 
     """
-    if not matched_queries:
+    if ranks.size == 0:
         return 0.0
-    return len([r for r in matched_queries if r.get("rank", 0) <= k]) / total_queries * 100
+    return int(np.count_nonzero(ranks <= k)) / total_queries * 100
 
 
-def evaluate(  # noqa: C901, PLR0913, PLR0912
+def evaluate(  # noqa: PLR0913
     *,
     batch_size: int,
     column: str,
@@ -45,9 +65,13 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
     match_field: str,
     opensearch: OpenSearchClient,
     reporter: IReporter,
-) -> list[dict[str, Any]]:
+) -> Iterator[dict[str, Any]]:
     """Evaluate search performance by running vector searches against a test dataset using batch processing.
 
+    Validation happens eagerly; the returned iterator streams one result
+    dict per row as each msearch batch completes, so callers can report
+    progress without holding every result in memory.
+
     Args:
         batch_size: Number of queries to process in each batch
         column: Column name to run the search against
@@ -61,7 +85,7 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
         pipeline_name: Name of the pipeline to use
 
     Returns:
-        List of dictionaries containing search results for each row
+        Iterator of dictionaries containing search results for each row
 
     """
     # Check if the specified columns exist in the dataset
@@ -76,7 +100,39 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
         f"Starting evaluation: index={index_name}queries={len(df)}, batch_size={batch_size}",
     )
 
-    results = []
+    return _iter_results(
+        batch_size=batch_size,
+        column=column,
+        df=df,
+        evaluation_columns=evaluation_columns,
+        index_name=index_name,
+        match_column=match_column,
+        match_field=match_field,
+        opensearch=opensearch,
+        reporter=reporter,
+    )
+
+
+def _iter_results(  # noqa: C901, PLR0913, PLR0912
+    *,
+    batch_size: int,
+    column: str,
+    df: pd.DataFrame,
+    evaluation_columns: list[str],
+    index_name: str,
+    match_column: str,
+    match_field: str,
+    opensearch: OpenSearchClient,
+    reporter: IReporter,
+) -> Iterator[dict[str, Any]]:
+    """Yield one result dict per row, batch by batch.
+
+    Identical query texts (common in real test datasets) are sent to
+    OpenSearch only once: responses are cached per query text and reused
+    across rows and batches.
+    """
+    processed = 0
+    response_cache: dict[str, dict[str, Any]] = {}
 
     # Process data in batches
     for batch_start in range(0, len(df), batch_size):
@@ -85,17 +141,26 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
 
         logger.debug(f"Processing batch: rows {batch_start + 1}-{batch_end}")
 
-        # Prepare batch queries
+        # Prepare batch queries, deduplicating against the response cache.
+        # Query texts and skip flags are computed for the whole batch in
+        # vectorized passes; iterrows would box every row into a Series
+        # and pay one __getitem__ per cell
+        # fillna matches the old str() behaviour: missing cells join as "nan"
+        query_series = (
+            batch_df[evaluation_columns].astype(str).fillna("nan").agg(" ".join, axis=1)
+        )
+        skip_flags = (query_series.str.strip().eq("") | query_series.eq("nan")).tolist()
+        match_values = (
+            batch_df[match_column].tolist() if match_column in batch_df.columns else None
+        )
+
         batch_queries = []
+        pending_queries: list[str] = []
         batch_metadata = []
 
-        for idx, row in batch_df.iterrows():
-            query_text = " ".join(
-                [str(row[evaluation_column]) for evaluation_column in evaluation_columns],
-            )
-
+        for position, (idx, query_text) in enumerate(query_series.items()):
             # Skip rows with NaN or empty values
-            if pd.isna(query_text) or str(query_text).strip() == "" or query_text == "nan":
+            if skip_flags[position]:
                 batch_metadata.append(
                     {
                         "row_index": idx,
@@ -106,77 +171,80 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
                 )
                 continue
 
-            batch_queries.append(
-                {
-                    "index": index_name,
-                },
-            )
-            batch_queries.append(
-                {
-                    "query": {"match": {column: query_text}},
-                    "_source": [match_field],
-                    "size": 50,
-                },
-            )
+            if query_text not in response_cache and query_text not in pending_queries:
+                pending_queries.append(query_text)
+                # Index is part of the msearch URL, so the header line stays empty
+                batch_queries.append({})
+                batch_queries.append(
+                    {
+                        "query": {"match": {column: query_text}},
+                        "_source": [match_field],
+                        "size": 50,
+                        # Ranks come from hit order; skip exact hit counting
+                        "track_total_hits": False,
+                    },
+                )
 
             batch_metadata.append(
                 {
                     "row_index": idx,
                     "query": query_text,
                     "skip": False,
-                    "row_data": row,
+                    "match_value": match_values[position] if match_values is not None else None,
                 },
             )
 
-        # Execute batch search if there are valid queries
-        if batch_queries:
+        # Execute batch search if there are rows to process
+        if batch_metadata:
             try:
-                # Use opensearch.request() for batch search
-                batch_response = opensearch.request(
-                    url="/_msearch",
-                    http_verb="POST",
-                    body="\n".join([json.dumps(query) for query in batch_queries]) + "\n",
-                )
+                if batch_queries:
+                    # Use opensearch.request() for batch search; orjson
+                    # emits bytes, so the NDJSON body is joined without
+                    # any intermediate Python strings
+                    batch_response = opensearch.request(
+                        url=f"/{index_name}/_msearch?filter_path={_MSEARCH_FILTER_PATH}",
+                        http_verb="POST",
+                        body=b"\n".join([orjson.dumps(query) for query in batch_queries]) + b"\n",
+                    )
+                    response_cache.update(
+                        zip(pending_queries, batch_response["responses"], strict=False),
+                    )
 
                 # Process batch results
-                response_idx = 0
                 for metadata in batch_metadata:
                     if metadata["skip"]:
-                        results.append(
-                            {
-                                "row_index": metadata["row_index"],
-                                "query": metadata["query"],
-                                "results": [],
-                                "error": metadata["error"],
-                            },
-                        )
+                        processed += 1
+                        yield {
+                            "row_index": metadata["row_index"],
+                            "query": metadata["query"],
+                            "results": [],
+                            "error": metadata["error"],
+                        }
                         continue
 
-                    if response_idx < len(batch_response["responses"]):
-                        response = batch_response["responses"][response_idx]
-                        response_idx += 1
-
+                    response = response_cache.get(metadata["query"])
+                    if response is not None:
                         if "error" in response:
                             logger.warning(f"Query error: {response['error']}")
-                            results.append(
-                                {
-                                    "row_index": metadata["row_index"],
-                                    "query": metadata["query"],
-                                    "results": [],
-                                    "error": str(response["error"]),
-                                },
-                            )
+                            processed += 1
+                            yield {
+                                "row_index": metadata["row_index"],
+                                "query": metadata["query"],
+                                "results": [],
+                                "error": str(response["error"]),
+                            }
                             continue
 
-                        # Extract search results (full documents)
-                        hits_count = len(response["hits"]["hits"])
+                        # Extract search results; a zero-hit response comes
+                        # back with no hits key at all under the filter_path
+                        hits = response.get("hits", {}).get("hits", [])
+                        hits_count = len(hits)
                         found_match = False
 
-                        for i, hit in enumerate(response["hits"]["hits"]):
-                            if hit["_source"].get(match_field) == metadata["row_data"].get(
-                                match_column,
-                            ):
-                                result = {
+                        for i, hit in enumerate(hits):
+                            if hit["_source"].get(match_field) == metadata["match_value"]:
+                                processed += 1
+                                yield {
                                     "row_index": metadata["row_index"],
                                     "query": metadata["query"],
                                     "score": hit["_score"],
@@ -184,7 +252,6 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
                                     "rank": i + 1,
                                     "hits_count": hits_count,
                                 }
-                                results.append(result)
                                 logger.debug(
                                     f"Row {metadata['row_index']}: rank={i + 1}/{hits_count}, "
                                     f"score={hit['_score']:.4f}",
@@ -193,14 +260,13 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
                                 break
 
                         if not found_match:
-                            results.append(
-                                {
-                                    "row_index": metadata["row_index"],
-                                    "query": metadata["query"],
-                                    "rank": None,
-                                    "hits_count": hits_count,
-                                },
-                            )
+                            processed += 1
+                            yield {
+                                "row_index": metadata["row_index"],
+                                "query": metadata["query"],
+                                "rank": None,
+                                "hits_count": hits_count,
+                            }
                             logger.debug(f"Row {metadata['row_index']}: No match found")
 
             except Exception as e:
@@ -208,14 +274,12 @@ def evaluate(  # noqa: C901, PLR0913, PLR0912
                 # Add error results for all queries in this batch
                 for metadata in batch_metadata:
                     if not metadata["skip"]:
-                        results.append(
-                            {
-                                "row_index": metadata["row_index"],
-                                "query": metadata["query"],
-                                "results": [],
-                                "error": str(e),
-                            },
-                        )
-
-    reporter.on_message(f"Evaluation complete: processed {len(results)} queries")
-    return results
+                        processed += 1
+                        yield {
+                            "row_index": metadata["row_index"],
+                            "query": metadata["query"],
+                            "results": [],
+                            "error": str(e),
+                        }
+
+    reporter.on_message(f"Evaluation complete: processed {processed} queries")
@@ -27,3 +27,12 @@ class FileFormat(Enum):
         extensions=frozenset(),
         ratio=0.15,
     )
+
+
+# One dict probe per lookup instead of a scan over every format's
+# extension set; unknown extensions fall back to DOCUMENT at the call site
+EXTENSION_TO_FORMAT: dict[str, FileFormat] = {
+    extension: file_format
+    for file_format in FileFormat
+    for extension in file_format.value.extensions
+}
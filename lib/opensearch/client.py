@@ -2,27 +2,59 @@ import os
 import re
 from typing import Any
 
+import orjson
 from botocore.credentials import Credentials
 from opensearchpy import AWSV4SignerAuth, OpenSearch, RequestsHttpConnection
-from opensearchpy.exceptions import AuthorizationException
+from opensearchpy.exceptions import AuthorizationException, SerializationError
+from opensearchpy.serializer import JSONSerializer
 
 from lib.interfaces import IReporter
 from lib.opensearch.repositories import IndexRepository
 from lib.opensearch.services.search_service import SearchService
 
 
+class _OrjsonSerializer(JSONSerializer):
+    """Transport serializer backed by orjson.
+
+    Query bodies (kNN vectors especially) and large _source responses are
+    encoded and decoded on every request; orjson does both in native code,
+    several times faster than the stdlib encoder the transport defaults to.
+    """
+
+    def dumps(self, data: Any) -> str | bytes:
+        if isinstance(data, (str, bytes)):
+            # Pre-serialized bodies (e.g. bulk NDJSON) pass through untouched
+            return data
+        try:
+            # OPT_SERIALIZE_NUMPY encodes embedding arrays (kNN query
+            # vectors) natively without a .tolist() round-trip
+            return orjson.dumps(
+                data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e) from e
+
+    def loads(self, s: str | bytes) -> Any:
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(s, e) from e
+
+
 class OpenSearchClient:
     def __init__(
         self,
         *,
         credentials: Credentials | None = None,
         host: str,
+        pool_maxsize: int = 32,
         port: int = 443,
         region: str = "us-east-1",
         reporter: IReporter,
     ) -> None:
         """Initialize OpenSearch client."""
         self._host = re.sub(r"^https?://", "", host)
+        self._pool_maxsize = pool_maxsize
         self._port = port
         self._region = region
         self._reporter = reporter
@@ -52,12 +84,20 @@ class OpenSearchClient:
             hosts=[{"host": self._host, "port": self._port}],
             http_compress=True,
             http_auth=http_auth,
+            # Default pool size of 1 would force a TLS handshake per
+            # concurrent request during bulk ingest and msearch batches
+            pool_maxsize=self._pool_maxsize,
             use_ssl=use_ssl,
             verify_certs=use_ssl,
             ssl_assert_hostname=False,
             ssl_show_warn=False,
             connection_class=RequestsHttpConnection,
             timeout=60,
+            # Transparent retries keep a transient timeout from surfacing
+            # as a failed search while the warm pool is re-established
+            max_retries=3,
+            retry_on_timeout=True,
+            serializer=_OrjsonSerializer(),
         )
 
         # Test the connection
@@ -102,12 +142,20 @@ class OpenSearchClient:
         )
         return idx.exists()
 
-    def bulk_index(self, *, body: str, pipeline_name: str | None = None) -> dict[str, Any]:
+    def bulk_index(
+        self,
+        *,
+        body: str | bytes,
+        filter_path: str | None = None,
+        pipeline_name: str | None = None,
+    ) -> dict[str, Any]:
         """
         Perform bulk indexing operation.
 
         Args:
             body: Bulk request body (newline-delimited JSON)
+            filter_path: Optional response filter (e.g. "errors,items.create.error");
+                the server omits everything else, shrinking the response body
             pipeline_name: Optional pipeline name to use for ingestion
 
         Returns:
@@ -116,6 +164,8 @@ class OpenSearchClient:
         params = {}
         if pipeline_name:
             params["pipeline"] = pipeline_name
+        if filter_path:
+            params["filter_path"] = filter_path
         return self._client.bulk(body=body, params=params)
 
     def count_documents(self, *, index: str) -> int:
@@ -129,7 +179,9 @@ class OpenSearchClient:
         *,
         url: str,
         http_verb: str = "GET",
-        body: str | None = None,
+        # Dict bodies are serialized by the transport (see _OrjsonSerializer);
+        # pre-serialized str/bytes bodies (e.g. msearch NDJSON) pass through
+        body: str | bytes | dict[str, Any] | None = None,
     ):
         if http_verb not in ["GET", "POST", "PUT", "DELETE"]:
             raise ValueError("Invalid HTTP verb")
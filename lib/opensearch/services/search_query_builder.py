@@ -2,6 +2,8 @@
 
 from typing import Any, Self
 
+import numpy as np
+
 from lib.interfaces import SearchQuery
 
 
@@ -43,8 +45,8 @@ class SearchQueryBuilder:
         self._query = {"term": {f"{field}.keyword": value}}
         return self
 
-    def match_knn(self, *, field: str, value: list[float]) -> Self:
-        """Add a vector to the query."""
+    def match_knn(self, *, field: str, value: list[float] | np.ndarray) -> Self:
+        """Add a vector to the query; arrays are serialized natively by the transport."""
         if "match" in self._query:
             raise ValueError("Cannot use match_knn() after match()")
         if "match_exactly" in self._query:
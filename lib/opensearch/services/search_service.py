@@ -18,3 +18,27 @@ class SearchService(BaseService, ISearchService):
             hits=response["hits"]["hits"],
             count=response["hits"]["total"]["value"],
         )
+
+    def multi_query(self, queries: list[SearchQuery]) -> list[SearchResults]:
+        """Execute several search queries in a single _msearch round trip.
+
+        One request replaces one round trip per query, so overall latency
+        is bounded by the slowest sub-search instead of their sum. msearch
+        has no per-query params line, so queries carrying params (e.g. a
+        search pipeline) must go through query() individually.
+        """
+        body: list[dict] = []
+        for query in queries:
+            if query.params:
+                raise ValueError("multi_query() does not support queries with params")
+            body.append({"index": query.index})
+            body.append(query.body)
+
+        response = self._client.msearch(body=body)
+        return [
+            SearchResults(
+                hits=item["hits"]["hits"],
+                count=item["hits"]["total"]["value"],
+            )
+            for item in response["responses"]
+        ]
@@ -12,8 +12,19 @@ else:
     RerankResponseTypeDef = dict[str, Any]
 
 
+def create_rerank_client(*, profile: str | None, region: str) -> BedrockAgentRuntimeClient:
+    """Create a Bedrock Agent Runtime client for rerank calls.
+
+    Split out so callers can build the client (credential resolution,
+    endpoint setup) ahead of time, e.g. concurrently with other I/O.
+    """
+    session = boto3.Session(profile_name=profile)
+    return session.client("bedrock-agent-runtime", region_name=region)  # type: ignore
+
+
 def rerank(
     *,
+    client: BedrockAgentRuntimeClient | None = None,
     profile: str | None,
     query: str,
     region: str,
@@ -21,9 +32,10 @@ def rerank(
     top_k: int = 3,
     sources: list[str],
 ) -> RerankResponseTypeDef | None:
-    # Create Bedrock Agent Runtime client
-    session = boto3.Session(profile_name=profile)
-    bedrock_client = session.client("bedrock-agent-runtime", region_name=region)  # type: ignore
+    # Create Bedrock Agent Runtime client unless the caller supplied one
+    bedrock_client = client if client is not None else create_rerank_client(
+        profile=profile, region=region
+    )
 
     try:
         # Ensure numberOfResults doesn't exceed the number of sources
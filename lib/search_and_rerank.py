@@ -14,12 +14,12 @@ from lib.interfaces import IReporter, SearchAndRerankResults
 from lib.logging import get_logger
 from lib.opensearch.client import OpenSearchClient
 from lib.opensearch.services import SearchQueryBuilder
-from lib.rerank import rerank
+from lib.rerank import create_rerank_client, rerank
 
 logger = get_logger(__name__)
 
 
-def search_and_rerank(  # noqa: PLR0913
+async def search_and_rerank(  # noqa: PLR0913
     *,
     column: str,
     embedding_column_suffix: str,
@@ -60,15 +60,28 @@ def search_and_rerank(  # noqa: PLR0913
     """
     reporter.on_message(f"Searching index '{index}' for query: {query}")
 
-    # Perform vector search
-    embedding = asyncio.run(get_embedding())
+    # Perform vector search; awaiting here keeps the caller's event loop
+    # (and its HTTP connection pool) alive instead of spinning up a new one.
+    # The rerank client init (credential resolution, endpoint setup) does
+    # not depend on the embedding, so it runs concurrently with it
+    rerank_client = None
+    if enable_reranking:
+        embedding, rerank_client = await asyncio.gather(
+            get_embedding(),
+            asyncio.to_thread(create_rerank_client, profile=profile, region=region),
+        )
+    else:
+        embedding = await get_embedding()
 
-    search_results = opensearch.search.query(
+    # The sync OpenSearch client blocks, so run the query off-loop to keep
+    # the event loop free for concurrent tasks
+    search_results = await asyncio.to_thread(
+        opensearch.search.query,
         SearchQueryBuilder(index=index)
         .match_knn(field=column, value=embedding)
         .add_filters(filters or [])
         .exclude_fields([f"*{embedding_column_suffix}"])
-        .build()
+        .build(),
     )
 
     reporter.on_message(f"Search returned {search_results.count} results")
@@ -90,6 +103,7 @@ def search_and_rerank(  # noqa: PLR0913
         reporter.on_message(f"Reranking {len(sources)} documents with query: {rerank_query}")
 
         rerank_results = rerank(
+            client=rerank_client,
             profile=profile,
             query=rerank_query,
             region=region,
@@ -1,12 +1,29 @@
 """OpenSearch cluster setup."""
 
+from dataclasses import dataclass
+
+from opensearchpy.exceptions import RequestError
+
 from lib.opensearch.client import OpenSearchClient
 from lib.opensearch.entities.index import VectorSearchEngine, VectorSearchSpaceType
 
 
+@dataclass(frozen=True)
+class SetupResult:
+    """Outcome of a setup run.
+
+    Callers use this for user feedback instead of probing the cluster
+    again, saving a round trip per invocation.
+    """
+
+    created: bool
+    existed: bool
+
+
 def setup_opensearch(  # noqa: PLR0913
     *,
     columns: list[str],
+    concurrent_segment_search_mode: str | None = "auto",
     delete: bool = False,
     ef_construction: int = 512,
     ef_search: int = 512,
@@ -17,11 +34,14 @@ def setup_opensearch(  # noqa: PLR0913
     opensearch: OpenSearchClient,
     space_type: str = VectorSearchSpaceType.L2.value,
     vector_dimension: int = 1024,
-) -> None:
+) -> SetupResult:
     """Setup OpenSearch cluster.
 
     Args:
         columns: List of columns to use for ingestion
+        concurrent_segment_search_mode: Cluster-level concurrent segment
+            search mode ("auto", "all", or "none"); None leaves the
+            cluster setting untouched
         delete: If True, delete existing resources before recreating
         ef_construction: HNSW ef_construction parameter for index creation
         ef_search: HNSW ef_search parameter for index creation
@@ -31,25 +51,48 @@ def setup_opensearch(  # noqa: PLR0913
         opensearch: OpenSearchClient instance
         space_type: Space type for vector similarity
         vector_dimension: Vector dimension for embeddings
+
+    Returns:
+        SetupResult describing whether the index was created and whether
+        it already existed
     """
-    index_exists = opensearch.indexes.exists(index_name=index_name)
-
-    if index_exists:
-        if delete:
-            idx = opensearch.indexes.get(index=index_name)
-            idx.delete()
-            index_exists = False
-        else:
-            return
-
-    opensearch.indexes.create(
-        index=index_name,
-        fields=columns,
-        ef_construction=ef_construction,
-        ef_search=ef_search,
-        embedding_column_suffix=embedding_column_suffix,
-        engine=VectorSearchEngine(engine),
-        m=m,
-        space_type=VectorSearchSpaceType(space_type),
-        vector_dimension=vector_dimension,
-    )
+    # Concurrent segment search scans a shard's segments in parallel, which
+    # cuts kNN query latency on multi-segment indices at the cost of higher
+    # CPU utilization on the data nodes; "auto" lets the cluster decide
+    # per query
+    if concurrent_segment_search_mode is not None:
+        opensearch.request(
+            http_verb="PUT",
+            url="/_cluster/settings",
+            body={
+                "persistent": {
+                    "search.concurrent_segment_search.mode": concurrent_segment_search_mode,
+                },
+            },
+        )
+
+    index_existed = False
+    if delete and opensearch.indexes.exists(index_name=index_name):
+        idx = opensearch.indexes.get(index=index_name)
+        idx.delete()
+        index_existed = True
+
+    # Create unconditionally and treat the conflict as "already exists":
+    # one PUT on the common path instead of a HEAD probe followed by a PUT
+    try:
+        opensearch.indexes.create(
+            index=index_name,
+            fields=columns,
+            ef_construction=ef_construction,
+            ef_search=ef_search,
+            embedding_column_suffix=embedding_column_suffix,
+            engine=VectorSearchEngine(engine),
+            m=m,
+            space_type=VectorSearchSpaceType(space_type),
+            vector_dimension=vector_dimension,
+        )
+    except RequestError as e:
+        if e.error != "resource_already_exists_exception":
+            raise
+        return SetupResult(created=False, existed=True)
+    return SetupResult(created=True, existed=index_existed)
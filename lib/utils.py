@@ -1,12 +1,84 @@
 """Utility functions for the OpenSearch CLI tool."""
 
+import contextlib
+import hashlib
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 import boto3
 from botocore.credentials import Credentials
+from botocore.utils import JSONFileCache
 
 from lib.opensearch.client import OpenSearchClient
 
+# Assumed-role credentials are cached on disk so repeated CLI invocations
+# skip the sts:AssumeRole round-trip while the session is still valid
+_STS_CACHE_DIR = Path.home() / ".cache" / "semantic-entity-matching" / "sts"
+_STS_CACHE_MARGIN = timedelta(minutes=5)
+
+
+def _sts_cache_path(*, assume_role: str, profile: str | None, region: str) -> Path:
+    """Build the cache file path for an (assume_role, profile, region) tuple."""
+    key = hashlib.sha1(f"{assume_role}|{profile}|{region}".encode()).hexdigest()  # noqa: S324
+    return _STS_CACHE_DIR / f"{key}.json"
+
+
+def _load_cached_sts_credentials(cache_path: Path) -> Credentials | None:
+    """Load cached STS credentials if they are still valid, else None."""
+    try:
+        cached = json.loads(cache_path.read_text())
+        expiration = datetime.fromisoformat(cached["Expiration"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if expiration <= datetime.now(UTC) + _STS_CACHE_MARGIN:
+        return None
+
+    return Credentials(
+        access_key=cached["AccessKeyId"],
+        secret_key=cached["SecretAccessKey"],
+        token=cached["SessionToken"],
+    )
+
+
+def _store_cached_sts_credentials(cache_path: Path, credentials: dict[str, Any]) -> None:
+    """Persist STS credentials to the on-disk cache (best effort)."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "AccessKeyId": credentials["AccessKeyId"],
+                    "SecretAccessKey": credentials["SecretAccessKey"],
+                    "SessionToken": credentials["SessionToken"],
+                    "Expiration": credentials["Expiration"].isoformat(),
+                }
+            )
+        )
+        cache_path.chmod(0o600)
+    except OSError:
+        # Caching is an optimization; never fail the command over it
+        pass
+
+
+def _enable_assume_role_cache(session: boto3.Session) -> None:
+    """Attach the AWS CLI's file cache to the session's assume-role provider.
+
+    Profiles configured with a role_arn assume their role through
+    botocore, which holds nothing across processes by default; pointing
+    its provider at ~/.aws/cli/cache (the cache the AWS CLI itself uses)
+    amortizes the STS call across CLI invocations until the session
+    expires. Best effort: the provider lookup is a private botocore API.
+    """
+    with contextlib.suppress(Exception):
+        provider = session._session.get_component("credential_provider")  # noqa: SLF001
+        provider.get_provider("assume-role").cache = JSONFileCache(
+            os.path.expanduser("~/.aws/cli/cache")
+        )
+
 
 def get_aws_credentials(
     *,
@@ -32,9 +104,16 @@ def get_aws_credentials(
     """
     # Create a boto3 session with the specified profile (if any)
     session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+    _enable_assume_role_cache(session)
 
     # If an assume role is provided, assume it and get temporary credentials
     if assume_role:
+        cache_path = _sts_cache_path(assume_role=assume_role, profile=profile, region=region)
+        cached_credentials = _load_cached_sts_credentials(cache_path)
+        if cached_credentials is not None:
+            print(f"Using cached credentials for role: {assume_role}")
+            return cached_credentials
+
         print(f"Assuming role: {assume_role}")
         sts_client = session.client("sts", region_name=region)
 
@@ -47,6 +126,7 @@ def get_aws_credentials(
 
             # Extract the temporary credentials
             credentials = response["Credentials"]
+            _store_cached_sts_credentials(cache_path, credentials)
 
             # Create credentials object for OpenSearch client
             assumed_credentials = Credentials(
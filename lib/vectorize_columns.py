@@ -1,15 +1,18 @@
 """Core vectorization logic for generating embeddings from text data."""
 
 import asyncio
+from collections.abc import Callable, Coroutine, Iterator
 from typing import Any, Literal
 
 import nest_asyncio  # type: ignore
+import numpy as np
 import pandas as pd
 from pandas.core.series import Series
 
 from lib.async_batch_processor import AsyncBatchProcessor, ProcessorConfig, ProcessorResult
 from lib.bedrock import (
     BedrockClient,
+    CoalescingEmbedder,
     EmbeddingModelOutput,
     EmbeddingType,
     InputType,
@@ -24,6 +27,143 @@ nest_asyncio.apply()  # type: ignore
 
 logger = get_logger(__name__)
 
+# One long-lived loop for all embedding work in this module: a loop per
+# batch would strand the Bedrock client's loop-bound connection pool
+# between batches, forcing a client rebuild every batch_size rows
+_event_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the loop embedding batches run on, creating it on first use.
+
+    Callers that warm up the Bedrock client before vectorizing should do
+    so on this loop, otherwise the warmed client is discarded when the
+    first batch runs under a different one.
+    """
+    global _event_loop  # noqa: PLW0603
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
+def _build_process_row(  # noqa: PLR0913
+    *,
+    bedrock_model_id: str,
+    columns: list[str],
+    embedding_type: EmbeddingType,
+    invoke_embedding_model_command: InvokeEmbeddingModelCommand,
+    output_dimension: int,
+    strategy: Literal["per-column", "combined"],
+) -> Callable[[pd.Series], Coroutine[Any, Any, list[EmbeddingModelOutput]]]:
+    """Build the per-row embedding coroutine shared by both entry points.
+
+    All rows funnel through one CoalescingEmbedder, so texts from
+    concurrent workers share multi-input Bedrock requests instead of
+    paying one round-trip per row.
+    """
+    embedder = CoalescingEmbedder(
+        command=invoke_embedding_model_command,
+        embedding_types=[embedding_type],
+        input_type=InputType.CLASSIFICATION,
+        model_id=InvokeEmbeddingModelCommand.get_model_id(bedrock_model_id),
+        output_dimension=output_dimension,
+    )
+
+    async def process_row(row: pd.Series) -> list[EmbeddingModelOutput]:
+        texts = (
+            row[columns].tolist()
+            if strategy == "per-column"
+            else [" ".join(row[columns].tolist())]
+        )
+        return list(await asyncio.gather(*(embedder.embed(text) for text in texts)))
+
+    return process_row
+
+
+def _process_rows(
+    *,
+    max_attempts: int,
+    num_workers: int,
+    process_row: Callable[[pd.Series], Coroutine[Any, Any, list[EmbeddingModelOutput]]],
+    reporter: IReporter,
+    rows: list[Series],
+) -> ProcessorResult[list[EmbeddingModelOutput]]:
+    """Run the embedding coroutine over rows with the AsyncBatchProcessor."""
+
+    async def _main() -> ProcessorResult[list[EmbeddingModelOutput]]:
+        processor = AsyncBatchProcessor[Series, list[EmbeddingModelOutput]](
+            items=rows,
+            processor_func=process_row,
+            config=ProcessorConfig(
+                max_attempts=max_attempts,
+                num_workers=num_workers,
+                handle_throttling=True,
+                on_progress=reporter.on_progress,
+            ),
+        )
+        return await processor.process()
+
+    return get_event_loop().run_until_complete(_main())
+
+
+def _extract_batch_embeddings(
+    processor_result: ProcessorResult[list[EmbeddingModelOutput]],
+    embedding_type: EmbeddingType,
+) -> list[list[Any]]:
+    """Raise the first processing exception, else unpack per-row embeddings.
+
+    Embeddings are stored as float32 numpy arrays: ~4 bytes per value
+    instead of ~28 for boxed Python floats, which cuts peak memory for
+    wide embedding columns roughly sevenfold.
+    """
+    for result in processor_result.results:
+        if isinstance(result, Exception):
+            raise result
+
+    # At this point, all results are list[EmbeddingModelOutput] (exceptions already raised)
+    return [
+        # Adapters already return numpy arrays in the right dtype (float32
+        # for FLOAT, int8/uint8 for quantized types); asarray is a no-op
+        # for them and only converts stray list inputs
+        [np.asarray(output.embeddings[embedding_type]) for output in result]
+        for result in processor_result.results
+        if not isinstance(result, Exception)
+    ]
+
+
+def _assign_embedding_columns(
+    *,
+    batch_embeddings: list[list[Any]],
+    columns: list[str],
+    df: pd.DataFrame,
+    embedding_column_suffix: str,
+    strategy: Literal["per-column", "combined"],
+) -> None:
+    """Attach embedding columns to df in place."""
+    if strategy == "per-column":
+        if batch_embeddings and len(columns) > 1 and len(batch_embeddings[0]) != len(columns):
+            logger.warning(
+                "Number of returned embeddings (%d) does not match number of columns (%d). "
+                "This might happen if the model combines inputs (e.g. Titan). "
+                "Assigning the first embedding to all columns.",
+                len(batch_embeddings[0]),
+                len(columns),
+            )
+
+        for i, column in enumerate(columns):
+            # Extract the i-th embedding from each batch
+            col_vectors: list[Any] = []
+            for batch in batch_embeddings:
+                # Use i-th embedding if available, otherwise use 0-th (fallback for combined models)
+                idx = i if i < len(batch) else 0
+                col_vectors.append(batch[idx])
+
+            df[f"{column}{embedding_column_suffix}"] = col_vectors
+    else:
+        # Combined strategy
+        col_vectors = [batch[0] for batch in batch_embeddings]
+        df["_".join(columns) + embedding_column_suffix] = col_vectors
+
 
 def vectorize_columns(  # noqa: C901, PLR0913
     *,
@@ -75,35 +215,24 @@ def vectorize_columns(  # noqa: C901, PLR0913
     # Convert DataFrame rows to list of Series
     rows = [row for _, row in df.iterrows()]
 
-    # Define async processor function
-    async def process_row(row: pd.Series) -> list[EmbeddingModelOutput]:
-        return await invoke_embedding_model_command.execute(
-            embedding_types=[embedding_type],
-            inputs=row[columns].tolist()
-            if strategy == "per-column"
-            else [" ".join(row[columns].tolist())],
-            input_type=InputType.CLASSIFICATION,
-            model_id=InvokeEmbeddingModelCommand.get_model_id(bedrock_model_id),
-            output_dimension=output_dimension,
-        )
-
-    # Process rows using AsyncBatchProcessor
-    async def _main() -> ProcessorResult[list[EmbeddingModelOutput]]:
-        processor = AsyncBatchProcessor[Series, list[EmbeddingModelOutput]](
-            items=rows,
-            processor_func=process_row,
-            config=ProcessorConfig(
-                max_attempts=max_attempts,
-                num_workers=num_workers,
-                handle_throttling=True,
-                on_progress=reporter.on_progress,
-            ),
-        )
-        return await processor.process()
+    process_row = _build_process_row(
+        bedrock_model_id=bedrock_model_id,
+        columns=columns,
+        embedding_type=embedding_type,
+        invoke_embedding_model_command=invoke_embedding_model_command,
+        output_dimension=output_dimension,
+        strategy=strategy,
+    )
 
     try:
         reporter.start_progress(total=len(rows))
-        processor_result = asyncio.run(_main())
+        processor_result = _process_rows(
+            max_attempts=max_attempts,
+            num_workers=num_workers,
+            process_row=process_row,
+            reporter=reporter,
+            rows=rows,
+        )
     finally:
         reporter.stop_progress()
 
@@ -119,42 +248,155 @@ def vectorize_columns(  # noqa: C901, PLR0913
     if processor_result.total_failed > 0:
         reporter.on_message(f"Failed: {processor_result.total_failed} requests")
 
-    # Check for exceptions and narrow types
-    for result in processor_result.results:
-        if isinstance(result, Exception):
-            raise result
+    batch_embeddings = _extract_batch_embeddings(processor_result, embedding_type)
 
-    # At this point, all results are list[EmbeddingModelOutput] (exceptions already raised)
-    # Convert requests to embeddings)
+    _assign_embedding_columns(
+        batch_embeddings=batch_embeddings,
+        columns=columns,
+        df=df,
+        embedding_column_suffix=embedding_column_suffix,
+        strategy=strategy,
+    )
 
-    batch_embeddings = [
-        [output.embeddings[embedding_type] for output in result]
-        for result in processor_result.results
-        if not isinstance(result, Exception)
-    ]
+    return df
 
-    if strategy == "per-column":
-        if batch_embeddings and len(columns) > 1 and len(batch_embeddings[0]) != len(columns):
-            logger.warning(
-                "Number of returned embeddings (%d) does not match number of columns (%d). "
-                "This might happen if the model combines inputs (e.g. Titan). "
-                "Assigning the first embedding to all columns.",
-                len(batch_embeddings[0]),
-                len(columns),
+
+def iter_vectorized_batches(  # noqa: PLR0913
+    *,
+    batch_size: int = 1000,
+    bedrock_model_id: str,
+    client: BedrockClient,
+    columns: list[str],
+    df: pd.DataFrame,
+    embedding_column_suffix: str = "_embedding",
+    embedding_type: EmbeddingType = EmbeddingType.FLOAT,
+    max_attempts: int = 10,
+    num_workers: int = 100,
+    output_dimension: int = 1024,
+    reporter: IReporter,
+    strategy: Literal["per-column", "combined"] = "per-column",
+) -> Iterator[pd.DataFrame]:
+    """Vectorize columns batch by batch, yielding each embedded row-batch.
+
+    Streaming counterpart to vectorize_columns: callers can write each
+    batch to disk as it completes, so peak memory holds one batch of
+    embeddings instead of the whole result DataFrame. Validation happens
+    eagerly; embedding work starts once the iterator is consumed.
+
+    Args:
+        batch_size: Number of rows per yielded batch
+        bedrock_model_id: Bedrock model ID for embeddings
+        client: BedrockClient instance
+        columns: List of column names to vectorize
+        df: DataFrame containing the data
+        embedding_column_suffix: Suffix to append to column names for embedding columns
+        embedding_type: Type of embedding to generate
+        max_attempts: Maximum number of retry attempts for failed requests
+        num_workers: Number of concurrent workers (default: 100)
+        output_dimension: Desired embedding dimension (default: 1024)
+        reporter: Reporter for status messages and progress updates
+        strategy: Vectorization strategy ("per-column" or "combined")
+
+    Returns:
+        Iterator of DataFrame batches with embedding columns attached
+
+    Raises:
+        ValueError: If columns don't exist in the file
+
+    """
+    # Validate columns exist
+    missing_columns = [col for col in columns if col not in df.columns]
+    if missing_columns:
+        raise ValueError(
+            f"Columns not found in file: {missing_columns}. Available columns: {list(df.columns)}",
+        )
+
+    reporter.on_message(f"Vectorizing columns: {columns} using strategy: {strategy}\n")
+
+    return _iter_batches(
+        batch_size=batch_size,
+        bedrock_model_id=bedrock_model_id,
+        client=client,
+        columns=columns,
+        df=df,
+        embedding_column_suffix=embedding_column_suffix,
+        embedding_type=embedding_type,
+        max_attempts=max_attempts,
+        num_workers=num_workers,
+        output_dimension=output_dimension,
+        reporter=reporter,
+        strategy=strategy,
+    )
+
+
+def _iter_batches(  # noqa: PLR0913
+    *,
+    batch_size: int,
+    bedrock_model_id: str,
+    client: BedrockClient,
+    columns: list[str],
+    df: pd.DataFrame,
+    embedding_column_suffix: str,
+    embedding_type: EmbeddingType,
+    max_attempts: int,
+    num_workers: int,
+    output_dimension: int,
+    reporter: IReporter,
+    strategy: Literal["per-column", "combined"],
+) -> Iterator[pd.DataFrame]:
+    """Yield one embedded row-batch at a time."""
+    invoke_command = InvokeModelCommand(client=client)
+    invoke_embedding_model_command = InvokeEmbeddingModelCommand(invoke_command)
+
+    process_row = _build_process_row(
+        bedrock_model_id=bedrock_model_id,
+        columns=columns,
+        embedding_type=embedding_type,
+        invoke_embedding_model_command=invoke_embedding_model_command,
+        output_dimension=output_dimension,
+        strategy=strategy,
+    )
+
+    total_retried = 0
+    total_failed = 0
+
+    try:
+        reporter.start_progress(total=len(df))
+        for batch_start in range(0, len(df), batch_size):
+            batch_df = df.iloc[batch_start : batch_start + batch_size].copy()
+            rows = [row for _, row in batch_df.iterrows()]
+
+            processor_result = _process_rows(
+                max_attempts=max_attempts,
+                num_workers=num_workers,
+                process_row=process_row,
+                reporter=reporter,
+                rows=rows,
             )
+            total_retried += processor_result.total_retried
+            total_failed += processor_result.total_failed
 
-        for i, column in enumerate(columns):
-            # Extract the i-th embedding from each batch
-            col_vectors: list[Any] = []
-            for batch in batch_embeddings:
-                # Use i-th embedding if available, otherwise use 0-th (fallback for combined models)
-                idx = i if i < len(batch) else 0
-                col_vectors.append(batch[idx])
+            batch_embeddings = _extract_batch_embeddings(processor_result, embedding_type)
 
-            df[f"{column}{embedding_column_suffix}"] = col_vectors
-    else:
-        # Combined strategy
-        col_vectors = [batch[0] for batch in batch_embeddings]
-        df["_".join(columns) + embedding_column_suffix] = col_vectors
+            _assign_embedding_columns(
+                batch_embeddings=batch_embeddings,
+                columns=columns,
+                df=batch_df,
+                embedding_column_suffix=embedding_column_suffix,
+                strategy=strategy,
+            )
+            yield batch_df
+    finally:
+        reporter.stop_progress()
 
-    return df
+    # Get and report token usage
+    input_tokens, output_tokens = invoke_embedding_model_command.get_tokens_count()
+    reporter.on_message(
+        f"\nToken usage: {input_tokens} input tokens, {output_tokens} output tokens"
+    )
+
+    # Report statistics
+    if total_retried > 0:
+        reporter.on_message(f"Retried: {total_retried} requests")
+    if total_failed > 0:
+        reporter.on_message(f"Failed: {total_failed} requests")
@@ -146,7 +146,7 @@ class TestIngestCommand:
         assert call_kwargs["index_name"] == "test-index"
         assert call_kwargs["max_attempts"] == 5
         assert call_kwargs["opensearch"] == mock_client_instance
-        assert isinstance(call_kwargs["rows"], list)
+        assert call_kwargs["df"] is test_df
 
     @patch("apps.cli.commands.ingest.ingest")
     @patch("apps.cli.commands.ingest.DataReader")
@@ -42,10 +42,10 @@ class TestSearchCommand:
         assert hasattr(search, "main")
         assert callable(search.main)
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_basic_search(
         self,
         mock_get_credentials: Any,
@@ -101,6 +101,7 @@ class TestSearchCommand:
         # Call main function
         search.main(
             assume_role=None,
+            bedrock_model_id="amazon.titan-embed-text-v2:0",
             column="LONG_COMMON_NAME",
             filter_field=None,
             filter_value=None,
@@ -110,6 +111,7 @@ class TestSearchCommand:
             profile=None,
             query="test query",
             region="us-east-1",
+            vector_dimension=1024,
         )
 
         # Verify AWS credentials were requested
@@ -149,10 +151,10 @@ class TestSearchCommand:
         assert "test query" in captured.out
         assert "Found 5 results:" in captured.out
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_search_with_filters(
         self,
         mock_get_credentials: Any,
@@ -201,6 +203,7 @@ class TestSearchCommand:
         # Call main function with filters
         search.main(
             assume_role=None,
+            bedrock_model_id="amazon.titan-embed-text-v2:0",
             column="LONG_COMMON_NAME",
             filter_field="CLASS",
             filter_value="MICRO",
@@ -210,6 +213,7 @@ class TestSearchCommand:
             profile=None,
             query="test query",
             region="us-east-1",
+            vector_dimension=1024,
         )
 
         # Verify search_and_rerank was called with filters
@@ -221,10 +225,10 @@ class TestSearchCommand:
         captured = capsys.readouterr()
         assert "Filters:" in captured.out
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_search_with_all_parameters(
         self,
         mock_get_credentials: Any,
@@ -258,6 +262,7 @@ class TestSearchCommand:
         # Call main function with all parameters
         search.main(
             assume_role="arn:aws:iam::123456789012:role/test-role",
+            bedrock_model_id="amazon.titan-embed-text-v2:0",
             column="LONG_COMMON_NAME",
             filter_field="CLASS",
             filter_value="MICRO",
@@ -267,6 +272,7 @@ class TestSearchCommand:
             profile="test-profile",
             query="test query",
             region="us-west-2",
+            vector_dimension=1024,
         )
 
         # Verify parameters were passed correctly
@@ -290,6 +296,7 @@ class TestSearchCommand:
         with pytest.raises(SystemExit):
             search.main(
                 assume_role=None,
+                bedrock_model_id="amazon.titan-embed-text-v2:0",
                 column="LONG_COMMON_NAME",
                 filter_field=None,
                 filter_value=None,
@@ -299,12 +306,13 @@ class TestSearchCommand:
                 profile=None,
                 query="",  # Empty query
                 region="us-east-1",
+                vector_dimension=1024,
             )
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_search_error_handling(
         self,
         mock_get_credentials: Any,
@@ -332,6 +340,7 @@ class TestSearchCommand:
         with pytest.raises(SystemExit):
             search.main(
                 assume_role=None,
+                bedrock_model_id="amazon.titan-embed-text-v2:0",
                 column="LONG_COMMON_NAME",
                 filter_field=None,
                 filter_value=None,
@@ -341,12 +350,13 @@ class TestSearchCommand:
                 profile=None,
                 query="test query",
                 region="us-east-1",
+                vector_dimension=1024,
             )
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_search_with_no_rerank_results(
         self,
         mock_get_credentials: Any,
@@ -394,6 +404,7 @@ class TestSearchCommand:
         # Call main function
         search.main(
             assume_role=None,
+            bedrock_model_id="amazon.titan-embed-text-v2:0",
             column="LONG_COMMON_NAME",
             filter_field=None,
             filter_value=None,
@@ -403,16 +414,17 @@ class TestSearchCommand:
             profile=None,
             query="test query",
             region="us-east-1",
+            vector_dimension=1024,
         )
 
         # Verify error message for failed rerank
         captured = capsys.readouterr()
         assert "Failed to get rerank results" in captured.out
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_search_filter_without_value(
         self,
         mock_get_credentials: Any,
@@ -446,6 +458,7 @@ class TestSearchCommand:
         # Call main function with only filter_field (no filter_value)
         search.main(
             assume_role=None,
+            bedrock_model_id="amazon.titan-embed-text-v2:0",
             column="LONG_COMMON_NAME",
             filter_field="CLASS",
             filter_value=None,  # No filter value
@@ -455,6 +468,7 @@ class TestSearchCommand:
             profile=None,
             query="test query",
             region="us-east-1",
+            vector_dimension=1024,
         )
 
         # Verify filters is None (not applied)
@@ -462,10 +476,10 @@ class TestSearchCommand:
         call_kwargs = mock_search_and_rerank.call_args[1]
         assert call_kwargs["filters"] is None
 
-    @patch("apps.cli.commands.search.search_and_rerank")
-    @patch("apps.cli.commands.search.BedrockClient")
-    @patch("apps.cli.commands.search.OpenSearchClient")
-    @patch("apps.cli.commands.search.get_aws_credentials")
+    @patch("lib.search_and_rerank.search_and_rerank")
+    @patch("lib.bedrock.BedrockClient")
+    @patch("lib.opensearch.client.OpenSearchClient")
+    @patch("lib.utils.get_aws_credentials")
     def test_search_with_custom_embedding_column_suffix(
         self,
         mock_get_credentials: Any,
@@ -499,6 +513,7 @@ class TestSearchCommand:
         # Call main function with custom embedding_column_suffix
         search.main(
             assume_role=None,
+            bedrock_model_id="amazon.titan-embed-text-v2:0",
             column="LONG_COMMON_NAME",
             embedding_column_suffix="_vector",  # Custom suffix
             filter_field=None,
@@ -509,6 +524,7 @@ class TestSearchCommand:
             profile=None,
             query="test query",
             region="us-east-1",
+            vector_dimension=1024,
         )
 
         # Verify embedding_column_suffix was passed correctly
@@ -4,7 +4,7 @@ Unit tests for vectorize CLI command.
 
 import json
 import os
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -53,8 +53,8 @@ class TestVectorizeCommand:
 
     @pytest.fixture
     def mock_vectorize_columns(self) -> Generator[MagicMock, None, None]:
-        """Mock the vectorize_columns function."""
-        with patch("apps.cli.commands.vectorize.vectorize_columns") as mock:
+        """Mock the iter_vectorized_batches function."""
+        with patch("apps.cli.commands.vectorize.iter_vectorized_batches") as mock:
             # Setup mock to return a DataFrame
             def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
                 return pd.DataFrame(
@@ -95,7 +95,7 @@ class TestVectorizeCommand:
         assert hasattr(vectorize, "main")
         assert callable(vectorize.main)
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_basic_vectorization_per_column(
         self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str, tmp_path: Path
@@ -115,8 +115,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -155,7 +155,7 @@ class TestVectorizeCommand:
         assert "name_emb" in output_df.columns
         assert len(output_df) == 3
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_vectorization_combined_strategy(
         self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str, tmp_path: Path
@@ -174,8 +174,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -200,7 +200,7 @@ class TestVectorizeCommand:
         assert call_kwargs["strategy"] == "combined"
         assert call_kwargs["columns"] == ["name", "description"]
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_custom_output_path(self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str) -> None:
         """Test vectorization with custom output path."""
@@ -211,8 +211,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -240,7 +240,7 @@ class TestVectorizeCommand:
         # Clean up
         os.remove(custom_output)
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="n")
     def test_file_overwrite_declined(
         self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str, tmp_path: Path
@@ -253,8 +253,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -282,7 +282,7 @@ class TestVectorizeCommand:
         # Verify original content is preserved
         assert output_path.read_text() == "existing content"
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     def test_file_overwrite_flag(self, mock_vectorize: Any, sample_csv_file: str, tmp_path: Path) -> None:
         """Test that --overwrite flag automatically overwrites existing file."""
         result_df = pd.DataFrame(
@@ -292,8 +292,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -322,7 +322,7 @@ class TestVectorizeCommand:
         assert "name_emb" in output_df.columns
         assert len(output_df) == 1
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     def test_missing_columns_error(self, mock_vectorize: Any, sample_csv_file: str) -> None:
         """Test error handling for missing columns."""
 
@@ -350,7 +350,7 @@ class TestVectorizeCommand:
                 vectorize_strategy="per-column",
             )
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_skip_rows_functionality(
         self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str, tmp_path: Path
@@ -366,8 +366,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -394,7 +394,7 @@ class TestVectorizeCommand:
         # DataReader logic is tested in test_data_reader.py
         # Here we just ensure vectorize_columns was called successfully
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_limit_rows_functionality(
         self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str, tmp_path: Path
@@ -410,8 +410,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -434,7 +434,7 @@ class TestVectorizeCommand:
         # Verify successful call
         mock_vectorize.assert_called_once()
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_excel_file_support(self, mock_input: Any, mock_vectorize: Any, sample_excel_file: str) -> None:
         """Test that Excel files are supported."""
@@ -448,8 +448,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -473,7 +473,7 @@ class TestVectorizeCommand:
         expected_output = str(Path(sample_excel_file).parent / "sample_vectorized.csv")
         assert os.path.exists(expected_output)
 
-    @patch("apps.cli.commands.vectorize.vectorize_columns")
+    @patch("apps.cli.commands.vectorize.iter_vectorized_batches")
     @patch("builtins.input", return_value="y")
     def test_multiple_columns(self, mock_input: Any, mock_vectorize: Any, sample_csv_file: str) -> None:
         """Test vectorization of multiple columns."""
@@ -486,8 +486,8 @@ class TestVectorizeCommand:
             }
         )
 
-        def side_effect(*args: Any, **kwargs: Any) -> pd.DataFrame:
-            return result_df
+        def side_effect(*args: Any, **kwargs: Any) -> Iterator[pd.DataFrame]:
+            return iter([result_df])
 
         mock_vectorize.side_effect = side_effect
 
@@ -338,6 +338,66 @@ class TestErrorHandling:
         assert isinstance(result.results[3], ValueError)
         assert result.results[4] == 10
 
+    @pytest.mark.asyncio
+    async def test_failure_counter_matches_exception_entries(self) -> None:
+        """Test that total_failed matches the number of Exception results."""
+
+        # Arrange
+        async def mixed_func(x: int) -> int:
+            if x % 3 == 0:
+                raise ValueError(f"Multiple of three: {x}")
+            return x * 2
+
+        items = list(range(12))
+        processor = AsyncBatchProcessor(
+            items=items,
+            processor_func=mixed_func,
+            config=ProcessorConfig(num_workers=4),
+        )
+
+        # Act
+        result = await processor.process()
+
+        # Assert - The counter must agree with the results list since
+        # process() no longer recounts failures by scanning it
+        exception_count = sum(1 for r in result.results if isinstance(r, Exception))
+        assert result.total_failed == exception_count == 4
+        assert result.total_processed == len(items) - exception_count
+
+    @pytest.mark.asyncio
+    async def test_streaming_mode_returns_failures_only(self) -> None:
+        """Test collect_results=False streams successes and keeps only failures."""
+
+        # Arrange
+        async def mixed_func(x: int) -> int:
+            if x % 2 == 0:
+                raise ValueError(f"Even number: {x}")
+            return x * 2
+
+        streamed: dict[int, int] = {}
+        items = [1, 2, 3, 4, 5]
+        processor = AsyncBatchProcessor(
+            items=items,
+            processor_func=mixed_func,
+            config=ProcessorConfig(
+                num_workers=2,
+                collect_results=False,
+                on_result=lambda index, output: streamed.__setitem__(index, output),
+            ),
+        )
+
+        # Act
+        result = await processor.process()
+
+        # Assert - no results list; successes went to the callback and
+        # failures are keyed by input index
+        assert result.results == []
+        assert streamed == {0: 2, 2: 6, 4: 10}
+        assert sorted(result.failures) == [1, 3]
+        assert all(isinstance(e, ValueError) for e in result.failures.values())
+        assert result.total_processed == 3
+        assert result.total_failed == 2
+
 
 # ============================================================================
 # Retry Logic Tests
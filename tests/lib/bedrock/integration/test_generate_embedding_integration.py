@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass, field
 
+import numpy as np
 import pytest
 
 from lib.bedrock import (
@@ -79,6 +80,6 @@ class TestGenerateEmbeddingIntegration:
             assert embedding_type in output.embeddings, (
                 f"Output should contain '{embedding_type.value}' key"
             )
-            assert isinstance(output.embeddings[embedding_type], list), (
-                f"Output should contain a list for '{embedding_type.value}' key"
+            assert isinstance(output.embeddings[embedding_type], np.ndarray), (
+                f"Output should contain an ndarray for '{embedding_type.value}' key"
             )
@@ -0,0 +1,115 @@
+"""Unit tests for CoalescingEmbedder."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from lib.bedrock import (
+    CoalescingEmbedder,
+    EmbeddingModelId,
+    EmbeddingModelOutput,
+    EmbeddingType,
+)
+
+
+def _make_command() -> AsyncMock:
+    """Mock command whose outputs encode the length of each input text."""
+
+    async def execute(**kwargs: Any) -> list[EmbeddingModelOutput]:
+        return [
+            EmbeddingModelOutput(
+                embeddings={
+                    EmbeddingType.FLOAT: np.asarray([float(len(text))], dtype=np.float32)
+                }
+            )
+            for text in kwargs["inputs"]
+        ]
+
+    command = AsyncMock()
+    command.execute = AsyncMock(side_effect=execute)
+    return command
+
+
+@pytest.mark.unit
+class TestCoalescingEmbedder:
+    """Tests for request coalescing, batch splitting, and error fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self) -> None:
+        """Test that calls inside the window coalesce into one execute call."""
+        command = _make_command()
+        embedder = CoalescingEmbedder(command=command, model_id=EmbeddingModelId.COHERE)
+
+        outputs = await asyncio.gather(
+            embedder.embed("a"), embedder.embed("bb"), embedder.embed("ccc")
+        )
+
+        assert command.execute.await_count == 1
+        assert command.execute.call_args.kwargs["inputs"] == ["a", "bb", "ccc"]
+        # Each caller got the output for its own text, in submission order
+        assert [output.embeddings[EmbeddingType.FLOAT][0] for output in outputs] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_batches_split_at_max_batch_size(self) -> None:
+        """Test that pending calls are cut into max_batch_size requests."""
+        command = _make_command()
+        embedder = CoalescingEmbedder(
+            command=command, max_batch_size=2, model_id=EmbeddingModelId.COHERE
+        )
+
+        await asyncio.gather(*(embedder.embed(str(i)) for i in range(5)))
+
+        batch_sizes = [
+            len(call.kwargs["inputs"]) for call in command.execute.call_args_list
+        ]
+        assert batch_sizes == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_error_fans_out_to_all_waiters(self) -> None:
+        """Test that a failed batch rejects every coalesced call."""
+        command = AsyncMock()
+        command.execute = AsyncMock(side_effect=RuntimeError("boom"))
+        embedder = CoalescingEmbedder(command=command, model_id=EmbeddingModelId.COHERE)
+
+        results = await asyncio.gather(
+            embedder.embed("a"), embedder.embed("b"), return_exceptions=True
+        )
+
+        assert command.execute.await_count == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_are_limited(self) -> None:
+        """Test that at most max_concurrent_batches requests run at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute(**kwargs: Any) -> list[EmbeddingModelOutput]:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return [
+                EmbeddingModelOutput(
+                    embeddings={EmbeddingType.FLOAT: np.asarray([0.0], dtype=np.float32)}
+                )
+                for _ in kwargs["inputs"]
+            ]
+
+        command = AsyncMock()
+        command.execute = AsyncMock(side_effect=execute)
+        embedder = CoalescingEmbedder(
+            command=command,
+            max_batch_size=1,
+            max_concurrent_batches=1,
+            model_id=EmbeddingModelId.COHERE,
+        )
+
+        await asyncio.gather(*(embedder.embed(str(i)) for i in range(3)))
+
+        assert command.execute.await_count == 3
+        assert max_in_flight == 1
@@ -1,8 +1,12 @@
 """Integration tests for Bedrock generate_embedding method."""
 
+from unittest.mock import AsyncMock
+
 import pytest
 
 from lib.bedrock import EmbeddingModelId, EmbeddingType, InputType, InvokeEmbeddingModelCommand
+from lib.bedrock.adapters.cohere_model_adapter import CohereModelAdapter
+from lib.bedrock.commands import invoke_embedding_model_command as command_module
 
 
 @pytest.mark.unit
@@ -56,3 +60,81 @@ class TestGenerateEmbeddingDimensionValidation:
                     embedding_types=[EmbeddingType.FLOAT],
                     output_dimension=output_dimension,
                 )
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Unit tests for the exact-match embedding cache."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        """Start each test with an empty cache."""
+        command_module._embedding_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_repeat_inputs_skip_bedrock(self) -> None:
+        """Test that previously embedded texts are served from the cache."""
+        invoke_model_command = AsyncMock()
+        invoke_model_command.execute.return_value = {"embedding": [0.1, 0.2, 0.3]}
+        command = InvokeEmbeddingModelCommand(invoke_model_command)
+
+        first = await command.execute(inputs=["alpha"], model_id=EmbeddingModelId.TITAN)
+        second = await command.execute(inputs=["alpha", "beta"], model_id=EmbeddingModelId.TITAN)
+
+        # "alpha" was cached by the first call, so only "beta" hit Bedrock
+        assert invoke_model_command.execute.await_count == 2
+        assert second[0] is first[0]
+        assert second[1].embeddings[EmbeddingType.FLOAT].tolist() == pytest.approx([0.1, 0.2, 0.3])
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_on_request_parameters(self) -> None:
+        """Test that changing input_type bypasses entries for the same text."""
+        invoke_model_command = AsyncMock()
+        invoke_model_command.execute.return_value = {"embedding": [0.1, 0.2, 0.3]}
+        command = InvokeEmbeddingModelCommand(invoke_model_command)
+
+        await command.execute(
+            inputs=["alpha"],
+            input_type=InputType.SEARCH_DOCUMENT,
+            model_id=EmbeddingModelId.TITAN,
+        )
+        await command.execute(
+            inputs=["alpha"],
+            input_type=InputType.SEARCH_QUERY,
+            model_id=EmbeddingModelId.TITAN,
+        )
+
+        assert invoke_model_command.execute.await_count == 2
+
+
+@pytest.mark.unit
+class TestCohereBatching:
+    """Unit tests for Cohere request batching."""
+
+    def test_format_input_splits_into_batches(self) -> None:
+        """Test that input lists larger than max_batch_size are chunked."""
+        adapter = CohereModelAdapter()
+        payloads = adapter.format_input(
+            inputs=[f"text {i}" for i in range(200)],
+            input_type=InputType.SEARCH_DOCUMENT,
+            embedding_types=[EmbeddingType.FLOAT],
+            output_dimension=1024,
+        )
+
+        assert [len(payload["texts"]) for payload in payloads] == [96, 96, 8]
+        assert payloads[1]["texts"][0] == "text 96"
+
+    def test_format_output_one_output_per_text(self) -> None:
+        """Test that batch responses are flattened back to per-text outputs."""
+        adapter = CohereModelAdapter()
+        outputs = adapter.format_output(
+            responses=[
+                {"embeddings": {"float": [[0.1, 0.2], [0.3, 0.4]], "int8": [[1, 2], [3, 4]]}},
+                {"embeddings": {"float": [[0.5, 0.6]], "int8": [[5, 6]]}},
+            ]
+        )
+
+        assert len(outputs) == 3
+        assert outputs[0].embeddings[EmbeddingType.FLOAT].tolist() == pytest.approx([0.1, 0.2])
+        assert outputs[1].embeddings[EmbeddingType.INT8].tolist() == [3, 4]
+        assert outputs[2].embeddings[EmbeddingType.FLOAT].tolist() == pytest.approx([0.5, 0.6])
@@ -30,7 +30,8 @@ class TestDataReader:
 
         assert len(reader) == len(df)
 
-        rows = [row.to_dict() for _, row in reader]
+        # Iteration yields (index, values) with plain tuples, not Series
+        rows = [dict(zip(df.columns, row, strict=True)) for _, row in reader]
         assert rows == df.to_dict("records")
 
         first_row = reader[0]
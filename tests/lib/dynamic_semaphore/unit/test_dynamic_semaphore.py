@@ -43,7 +43,8 @@ class TestDynamicSemaphoreInitialization:
         # Check auto-tuning calculations
         assert sem.capacity == 4
         assert sem._min_value == 1
-        assert sem._increase_threshold == initial * 10  # 40
+        # No fixed threshold: it tracks the current capacity
+        assert sem._increase_threshold is None
         assert sem._decrease_factor == 0.5
 
     def test_invalid_decrease_factor(self) -> None:
@@ -167,7 +168,7 @@ class TestDynamicSemaphoreThrottling:
     @pytest.mark.asyncio
     async def test_on_throttle_decreases_capacity(self) -> None:
         """Test that on_throttle decreases capacity by decrease_factor."""
-        sem = DynamicSemaphore(initial=10, decrease_factor=0.5)
+        sem = DynamicSemaphore(initial=10, decrease_factor=0.5, decrease_cooldown=0)
 
         await sem.on_throttle()
         assert sem.capacity == 5  # 10 * 0.5
@@ -181,7 +182,7 @@ class TestDynamicSemaphoreThrottling:
     @pytest.mark.asyncio
     async def test_on_throttle_respects_min_value(self) -> None:
         """Test that on_throttle never goes below min_value."""
-        sem = DynamicSemaphore(initial=10, min_value=3, decrease_factor=0.5)
+        sem = DynamicSemaphore(initial=10, min_value=3, decrease_factor=0.5, decrease_cooldown=0)
 
         await sem.on_throttle()  # 10 -> 5
         await sem.on_throttle()  # 5 -> 3 (capped)
@@ -207,7 +208,7 @@ class TestDynamicSemaphoreThrottling:
     @pytest.mark.asyncio
     async def test_on_throttle_with_custom_factor(self) -> None:
         """Test on_throttle with custom decrease_factor."""
-        sem = DynamicSemaphore(initial=100, decrease_factor=0.75)
+        sem = DynamicSemaphore(initial=100, decrease_factor=0.75, decrease_cooldown=0)
 
         await sem.on_throttle()
         assert sem.capacity == 75  # 100 * 0.75
@@ -215,6 +216,18 @@ class TestDynamicSemaphoreThrottling:
         await sem.on_throttle()
         assert sem.capacity == 56  # 75 * 0.75 (rounded down)
 
+    @pytest.mark.asyncio
+    async def test_on_throttle_cooldown_coalesces_bursts(self) -> None:
+        """A burst of throttle callbacks should count as a single decrease."""
+        sem = DynamicSemaphore(initial=10, decrease_factor=0.5, decrease_cooldown=1.0)
+
+        # All in-flight requests fail together on one throttle event
+        await sem.on_throttle()
+        await sem.on_throttle()
+        await sem.on_throttle()
+
+        assert sem.capacity == 5  # Halved once, not three times
+
 
 @pytest.mark.unit
 class TestDynamicSemaphoreSuccess:
@@ -282,6 +295,39 @@ class TestDynamicSemaphoreSuccess:
         await sem.on_success()
         assert sem.capacity == 14
 
+    @pytest.mark.asyncio
+    async def test_adaptive_threshold_scales_with_capacity(self) -> None:
+        """Without a fixed threshold, one success per slot triggers a bump."""
+        sem = DynamicSemaphore(initial=2)
+
+        # Capacity 2: two successes trigger an increase
+        await sem.on_success()
+        assert sem.capacity == 2
+        await sem.on_success()
+        assert sem.capacity == 3
+
+        # Capacity 3: three successes are now needed
+        await sem.on_success()
+        await sem.on_success()
+        assert sem.capacity == 3
+        await sem.on_success()
+        assert sem.capacity == 4
+
+    @pytest.mark.asyncio
+    async def test_on_success_respects_max_value(self) -> None:
+        """Test that growth stops at max_value when one is set."""
+        sem = DynamicSemaphore(initial=10, increase_threshold=2, max_value=11)
+
+        # Increase to 11 (the cap)
+        await sem.on_success()
+        await sem.on_success()
+        assert sem.capacity == 11
+
+        # Further successes do not grow past the cap
+        await sem.on_success()
+        await sem.on_success()
+        assert sem.capacity == 11
+
     @pytest.mark.asyncio
     async def test_on_success_notifies_waiting_tasks(self) -> None:
         """Test that capacity increase notifies waiting tasks."""
@@ -322,7 +368,9 @@ class TestDynamicSemaphoreAIMD:
     @pytest.mark.asyncio
     async def test_aimd_cycle(self) -> None:
         """Test complete AIMD cycle: increase gradually, decrease rapidly."""
-        sem = DynamicSemaphore(initial=10, increase_threshold=2, decrease_factor=0.5)
+        sem = DynamicSemaphore(
+            initial=10, increase_threshold=2, decrease_factor=0.5, decrease_cooldown=0
+        )
 
         # Start at 10
         assert sem.capacity == 10
@@ -352,7 +400,7 @@ class TestDynamicSemaphoreAIMD:
     @pytest.mark.asyncio
     async def test_multiple_throttles_converge_to_min(self) -> None:
         """Test that multiple throttles eventually reach min_value."""
-        sem = DynamicSemaphore(initial=100, min_value=1, decrease_factor=0.5)
+        sem = DynamicSemaphore(initial=100, min_value=1, decrease_factor=0.5, decrease_cooldown=0)
 
         capacities = [sem.capacity]
         for _ in range(10):
@@ -387,6 +435,48 @@ class TestDynamicSemaphoreAIMD:
         assert sem.capacity == 20
 
 
+@pytest.mark.unit
+class TestDynamicSemaphoreLatencyBrake:
+    """Test the latency congestion signal fed via record_latency."""
+
+    @pytest.mark.asyncio
+    async def test_degraded_latency_blocks_capacity_increase(self) -> None:
+        """Rising RTTs should stop on_success from growing capacity."""
+        sem = DynamicSemaphore(initial=2, increase_threshold=2)
+
+        # One fast baseline sample, then sustained slow responses
+        sem.record_latency(0.1)
+        for _ in range(20):
+            sem.record_latency(1.0)
+        assert sem._latency_degraded
+
+        await sem.on_success()
+        await sem.on_success()
+        assert sem.capacity == 2  # Growth braked
+
+    @pytest.mark.asyncio
+    async def test_recovered_latency_allows_growth_again(self) -> None:
+        """Once RTTs return to baseline, capacity can grow."""
+        sem = DynamicSemaphore(initial=2, increase_threshold=2)
+
+        sem.record_latency(0.1)
+        for _ in range(20):
+            sem.record_latency(1.0)
+        assert sem._latency_degraded
+
+        # Latency recovers: refill the whole sample window, then bypass
+        # the 1s recompute interval so the next sample re-evaluates
+        for _ in range(100):
+            sem.record_latency(0.1)
+        sem._last_latency_check = -1.0e18
+        sem.record_latency(0.1)
+        assert not sem._latency_degraded
+
+        await sem.on_success()
+        await sem.on_success()
+        assert sem.capacity == 3
+
+
 @pytest.mark.unit
 class TestDynamicSemaphoreLogLevel:
     """Test DynamicSemaphore logging behavior."""
@@ -450,7 +540,9 @@ class TestDynamicSemaphoreEdgeCases:
     @pytest.mark.asyncio
     async def test_stress_test_rapid_changes(self) -> None:
         """Test rapid alternating throttle and success calls."""
-        sem = DynamicSemaphore(initial=50, increase_threshold=10, decrease_factor=0.5)
+        sem = DynamicSemaphore(
+            initial=50, increase_threshold=10, decrease_factor=0.5, decrease_cooldown=0
+        )
 
         for _ in range(100):
             await sem.on_throttle()
@@ -463,7 +555,7 @@ class TestDynamicSemaphoreEdgeCases:
     @pytest.mark.asyncio
     async def test_concurrent_capacity_changes(self) -> None:
         """Test that concurrent capacity changes are thread-safe."""
-        sem = DynamicSemaphore(initial=20, increase_threshold=5)
+        sem = DynamicSemaphore(initial=20, increase_threshold=5, decrease_cooldown=0)
 
         async def throttle_worker() -> None:
             for _ in range(10):
@@ -0,0 +1,43 @@
+"""Unit tests for bulk body construction."""
+
+import orjson
+import pytest
+
+from lib.ingest import _create_bulk_body
+from lib.opensearch.client import _OrjsonSerializer
+
+
+@pytest.mark.unit
+class TestCreateBulkBody:
+    """Tests for the NDJSON bulk body."""
+
+    def test_bulk_body_structure(self) -> None:
+        """Test that each row becomes an action line and a document line."""
+        body = _create_bulk_body(
+            batch_rows=[{"name": "a", "price": 1.5}, {"name": "b", "skipped": None}],
+            index_name="test-index",
+            start_idx=10,
+        )
+
+        lines = body.rstrip(b"\n").split(b"\n")
+        assert [orjson.loads(line) for line in lines] == [
+            {"create": {"_index": "test-index", "_id": "10"}},
+            {"name": "a", "price": 1.5},
+            {"create": {"_index": "test-index", "_id": "11"}},
+            {"name": "b"},
+        ]
+
+    def test_bulk_body_survives_transport_serializer(self) -> None:
+        """Test that the bytes body passes through the transport serializer.
+
+        opensearch-py calls serializer.dumps on every non-None body, so
+        the pre-serialized NDJSON has to come back out untouched instead
+        of being rejected as a non-JSON-serializable type.
+        """
+        body = _create_bulk_body(
+            batch_rows=[{"name": "a"}],
+            index_name="test-index",
+            start_idx=0,
+        )
+
+        assert _OrjsonSerializer().dumps(body) is body
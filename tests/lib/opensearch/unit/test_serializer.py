@@ -0,0 +1,57 @@
+"""Unit tests for the orjson-backed transport serializer."""
+
+import numpy as np
+import orjson
+import pytest
+from opensearchpy.exceptions import SerializationError
+
+from lib.opensearch.client import _OrjsonSerializer
+
+
+@pytest.mark.unit
+class TestOrjsonSerializer:
+    """Tests for _OrjsonSerializer pass-through and encoding behavior."""
+
+    def test_bytes_body_passes_through(self) -> None:
+        """Test that pre-serialized bytes bodies (e.g. bulk NDJSON) are untouched."""
+        serializer = _OrjsonSerializer()
+        body = b'{"create": {"_index": "idx", "_id": "0"}}\n{"name": "a"}\n'
+
+        assert serializer.dumps(body) is body
+
+    def test_str_body_passes_through(self) -> None:
+        """Test that pre-serialized string bodies are untouched."""
+        serializer = _OrjsonSerializer()
+        body = '{"query": {"match_all": {}}}'
+
+        assert serializer.dumps(body) is body
+
+    def test_dict_body_is_serialized(self) -> None:
+        """Test that dict bodies are encoded to JSON."""
+        serializer = _OrjsonSerializer()
+
+        encoded = serializer.dumps({"size": 1, "query": {"match_all": {}}})
+
+        assert orjson.loads(encoded) == {"size": 1, "query": {"match_all": {}}}
+
+    def test_numpy_arrays_are_serialized(self) -> None:
+        """Test that embedding vectors encode without a tolist round-trip."""
+        serializer = _OrjsonSerializer()
+
+        encoded = serializer.dumps({"vector": np.asarray([0.5, 1.5], dtype=np.float32)})
+
+        assert orjson.loads(encoded) == {"vector": [0.5, 1.5]}
+
+    def test_unserializable_body_raises(self) -> None:
+        """Test that unserializable values raise SerializationError."""
+        serializer = _OrjsonSerializer()
+
+        with pytest.raises(SerializationError):
+            serializer.dumps({"bad": object()})
+
+    def test_loads_round_trip(self) -> None:
+        """Test that loads decodes both str and bytes payloads."""
+        serializer = _OrjsonSerializer()
+
+        assert serializer.loads(b'{"a": 1}') == {"a": 1}
+        assert serializer.loads('{"a": 1}') == {"a": 1}
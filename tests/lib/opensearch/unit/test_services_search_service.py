@@ -243,6 +243,55 @@ class TestSearchService:
         call_args = mock_client.search.call_args
         assert "size" not in call_args.kwargs["body"]
 
+    def test_multi_query_executes_single_msearch(self) -> None:
+        """Test that multi_query() packs all queries into one msearch call."""
+        mock_client = MagicMock()
+        mock_client.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": [{"_id": "1"}], "total": {"value": 1}}},
+                {"hits": {"hits": [], "total": {"value": 0}}},
+            ]
+        }
+
+        service = SearchService(client=mock_client)
+
+        queries = [
+            SearchQueryBuilder(index="test-index").match(field="title", value="query").build(),
+            SearchQueryBuilder(index="other-index").match(field="name", value="query").build(),
+        ]
+        results = service.multi_query(queries)
+
+        # Verify a single msearch call carried both queries
+        mock_client.msearch.assert_called_once()
+        body = mock_client.msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "test-index"}
+        assert body[1]["query"]["match"]["title"] == "query"
+        assert body[2] == {"index": "other-index"}
+        assert body[3]["query"]["match"]["name"] == "query"
+
+        assert len(results) == 2
+        assert all(isinstance(result, SearchResults) for result in results)
+        assert results[0].hits == [{"_id": "1"}]
+        assert results[0].count == 1
+        assert results[1].hits == []
+
+    def test_multi_query_rejects_queries_with_params(self) -> None:
+        """Test that multi_query() rejects queries carrying params."""
+        mock_client = MagicMock()
+
+        service = SearchService(client=mock_client)
+
+        query = (
+            SearchQueryBuilder(index="test-index")
+            .match(field="title", value="query")
+            .use_pipeline("test-pipeline")
+            .build()
+        )
+
+        with pytest.raises(ValueError, match="params"):
+            service.multi_query([query])
+        mock_client.msearch.assert_not_called()
+
     def test_query_with_vector_custom_size_affects_k(self) -> None:
         """Test that query() size parameter affects the k value in knn query."""
         mock_client = MagicMock()